@@ -7,6 +7,12 @@ from rich.console import Console
 
 from mkdocs_download.scraper import MkDocsScraper, ScraperConfig
 
+try:
+    # Faster event loop for the I/O-heavy crawl when available (Linux and macOS only)
+    import uvloop
+except ImportError:
+    uvloop = None
+
 console = Console()
 
 
@@ -65,7 +71,7 @@ def main(
     scraper = MkDocsScraper(config)
 
     try:
-        asyncio.run(scraper.run())
+        asyncio.run(scraper.run(), loop_factory=uvloop.new_event_loop if uvloop else None)
     except KeyboardInterrupt:
         console.print("\n[yellow]Interrupted by user[/yellow]")
     except Exception as e:
@@ -1,20 +1,160 @@
 """Core scraper module for MkDocs documentation sites."""
 
 import asyncio
+import functools
 import hashlib
+import io
+import itertools
+import json
+import multiprocessing
 import os
 import re
-from dataclasses import dataclass
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
 from urllib.parse import urljoin, urlparse
-from xml.etree import ElementTree
 
+import aiofiles
+import aiofiles.os
 import httpx
 from bs4 import BeautifulSoup, NavigableString, Tag
+from lxml import etree
+from lxml import html as lxml_html
 from rich.console import Console
 from rich.progress import BarColumn, Progress, SpinnerColumn, TaskProgressColumn, TextColumn
 
 console = Console()
 
+SITEMAP_NS = "{http://www.sitemaps.org/schemas/sitemap/0.9}"
+
+# Start method for the conversion processes. By the time the pool starts, this process runs
+# httpx and aiofiles helper threads, which forked children must not inherit.
+POOL_START_METHOD = (
+    "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+)
+
+# Sitemaps fetched at once; they are few and large, and page downloads run alongside
+SITEMAP_CONCURRENCY = 2
+
+# Elements stripped from the main content before conversion
+REMOVE_TAGS = frozenset({"nav", "footer", "button"})
+REMOVE_CLASSES = frozenset(
+    {
+        "md-content__button",
+        "md-footer-nav",
+        "md-source",
+        "md-source-file",
+        "git-revision-date-localized-plugin",
+    }
+)
+
+# Blocks removed as "Last updated" metadata when their own text (not their children's) says so
+METADATA_TAGS = frozenset({"p", "div", "span", "small"})
+LAST_UPDATED_RE = re.compile(r"last (?:updated|modified)", re.IGNORECASE)
+
+# Inline tags whose Markdown form is just their text
+PLAIN_INLINE_TAGS = frozenset({"span"})
+
+TABLE_CELL_TAGS = frozenset({"th", "td"})
+
+# Code block language classes, e.g. "language-python" or "highlight-python"
+CODE_LANG_RE = re.compile(r"^(?:language|highlight)-(.+)$")
+
+# File extensions of linked assets that are not documentation pages
+ASSET_EXTENSIONS = frozenset(
+    {".png", ".jpg", ".jpeg", ".gif", ".webp", ".svg", ".ico", ".pdf", ".zip", ".xml", ".json"}
+)
+
+# Leading "# Title" line of a converted page
+TITLE_LINE_RE = re.compile(r"^#\s+[^\n]+\n*")
+
+# Containers searched for links by the HTML fallback, most specific first
+NAV_XPATHS = (
+    '//nav[contains(concat(" ", normalize-space(@class), " "), " md-nav--primary ")]',
+    '//nav[contains(concat(" ", normalize-space(@class), " "), " md-nav ")]',
+    "//nav",
+    "//aside",
+)
+
+# Seconds between progress bar updates; Rich only redraws ten times a second anyway
+PROGRESS_INTERVAL = 0.1
+
+
+class SitemapParser:
+    """Incremental sitemap parser that collects <loc> URLs as bytes are fed in."""
+
+    def __init__(self) -> None:
+        self.is_index = False
+        self.urls: list[str] = []
+        self._parser = etree.XMLPullParser(events=("start", "end"), resolve_entities=False)
+
+    def feed(self, data: bytes) -> None:
+        """Parse the next chunk of the sitemap."""
+        self._parser.feed(data)
+        self._read_events()
+
+    def close(self) -> tuple[bool, list[str]]:
+        """Finish parsing, returning whether the sitemap is an index and its <loc> URLs."""
+        self._parser.close()
+        self._read_events()
+        return self.is_index, self.urls
+
+    def _read_events(self) -> None:
+        for event, elem in self._parser.read_events():
+            parent = elem.getparent()
+            if event == "start":
+                if parent is None:
+                    self.is_index = elem.tag.endswith("sitemapindex")
+                continue
+
+            if elem.tag == f"{SITEMAP_NS}loc":
+                if elem.text and elem.text.strip():
+                    self.urls.append(elem.text.strip())
+            elif parent is not None and parent.getparent() is None:
+                # Finished a <url>/<sitemap> entry, drop it and any earlier siblings
+                elem.clear()
+                while elem.getprevious() is not None:
+                    del parent[0]
+
+
+def _conditional_headers(cached: dict | None) -> dict[str, str]:
+    """Build If-None-Match / If-Modified-Since headers from cached response validators."""
+    headers = {}
+    if cached:
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+    return headers
+
+
+def _is_last_updated(elem: Tag) -> bool:
+    """Check whether an element's own text, ignoring its children, is a "Last updated" line."""
+    own_text = "".join(child for child in elem.children if isinstance(child, NavigableString))
+    return LAST_UPDATED_RE.search(own_text) is not None
+
+
+def _image_key(url: str) -> bytes:
+    """Get a compact 8-byte digest identifying an image URL."""
+    return hashlib.blake2b(url.encode(), digest_size=8).digest()
+
+
+@functools.lru_cache(maxsize=8)
+def _html_parser(encoding: str) -> lxml_html.HTMLParser:
+    """Get a reusable lxml HTML parser that decodes with the response's known charset."""
+    return lxml_html.HTMLParser(encoding=encoding)
+
+
+@functools.lru_cache(maxsize=64)
+def _detect_code_language(classes: tuple[str, ...]) -> str:
+    """Detect a code block language from its classes (language-* or MkDocs/Pygments highlight-*)."""
+    for cls in classes:
+        match = CODE_LANG_RE.match(cls)
+        if match:
+            return match.group(1)
+    return ""
+
 
 @dataclass
 class ScraperConfig:
@@ -28,7 +168,7 @@ class ScraperConfig:
     timeout: float = 30.0
 
 
-@dataclass
+@dataclass(slots=True)
 class ScraperStats:
     """Statistics for the scraping process."""
 
@@ -57,11 +197,10 @@ class HTMLToMarkdownConverter:
         self.images_to_download = []
         self.current_page_url = page_url
 
-        lines: list[str] = []
-        self._process_element(element, lines, depth=0)
-
-        # Join lines and clean up
-        markdown = "\n".join(lines)
+        # Write Markdown blocks (one per line) into a single growable buffer
+        out = io.StringIO()
+        self._process_element(element, out, depth=0)
+        markdown = out.getvalue()
 
         # Clean up excessive newlines
         markdown = re.sub(r"\n{4,}", "\n\n\n", markdown)
@@ -102,7 +241,7 @@ class HTMLToMarkdownConverter:
 
         return relative_img_path
 
-    def _process_image(self, element: Tag, lines: list) -> None:
+    def _process_image(self, element: Tag, out: io.StringIO) -> None:
         """Process an image element."""
         src = element.get("src", "")
         alt = element.get("alt", "")
@@ -126,17 +265,16 @@ class HTMLToMarkdownConverter:
         self.images_to_download.append((src, full_local_path))
 
         # Use the relative path from output_dir
-        lines.append(f"\n![{alt}]({local_img_path})\n")
+        out.write(f"\n![{alt}]({local_img_path})\n\n")
 
-    def _process_element(self, element: Tag | NavigableString, lines: list, depth: int = 0) -> None:
+    def _process_element(
+        self, element: Tag | NavigableString, out: io.StringIO, depth: int = 0
+    ) -> None:
         """Process an HTML element and convert to Markdown."""
         if isinstance(element, NavigableString):
             text = str(element).strip()
             if text:
-                if lines and not lines[-1].endswith("\n"):
-                    lines.append(text)
-                else:
-                    lines.append(text)
+                out.write(f"{text}\n")
             return
 
         if not isinstance(element, Tag):
@@ -150,34 +288,37 @@ class HTMLToMarkdownConverter:
 
         # Handle images
         if tag_name == "img":
-            self._process_image(element, lines)
+            self._process_image(element, out)
             return
 
         # Handle different tags
         if tag_name in ["h1", "h2", "h3", "h4", "h5", "h6"]:
             level = int(tag_name[1])
             # Remove anchor links and headerlink (MkDocs specific)
-            for anchor in element.find_all("a", class_="headerlink"):
+            for anchor in element.select("a.headerlink"):
                 anchor.decompose()
-            for anchor in element.find_all("a"):
-                if anchor.get("class") and "headerlink" in anchor.get("class", []):
-                    anchor.decompose()
             text = self._get_text(element).strip()
             # Remove paragraph symbol (¶) commonly used in MkDocs
             text = text.replace("¶", "").strip()
             if text:
-                lines.append(f"\n{'#' * level} {text}\n")
+                out.write(f"\n{'#' * level} {text}\n\n")
 
         elif tag_name == "p":
-            text_parts = []
-            for child in element.children:
-                if isinstance(child, NavigableString):
-                    text_parts.append(str(child))
-                elif isinstance(child, Tag):
-                    text_parts.append(self._inline_element(child))
-            text = "".join(text_parts).strip()
+            if all(
+                child.name is None or child.name in PLAIN_INLINE_TAGS for child in element.children
+            ):
+                # Text-only paragraph: a single get_text() walk is enough
+                text = element.get_text().strip()
+            else:
+                text_parts = []
+                for child in element.children:
+                    if isinstance(child, NavigableString):
+                        text_parts.append(str(child))
+                    elif isinstance(child, Tag):
+                        text_parts.append(self._inline_element(child))
+                text = "".join(text_parts).strip()
             if text:
-                lines.append(f"\n{text}\n")
+                out.write(f"\n{text}\n\n")
 
         elif tag_name == "pre":
             # Code block
@@ -185,60 +326,50 @@ class HTMLToMarkdownConverter:
             if code_elem:
                 code_text = code_elem.get_text()
                 # Try to detect language from class
-                classes = code_elem.get("class", [])
-                lang = ""
-                for cls in classes:
-                    if isinstance(cls, str):
-                        if cls.startswith("language-"):
-                            lang = cls.replace("language-", "")
-                            break
-                        # MkDocs/Pygments style
-                        if cls.startswith("highlight-"):
-                            lang = cls.replace("highlight-", "")
-                            break
-                lines.append(f"\n```{lang}\n{code_text}\n```\n")
+                lang = _detect_code_language(tuple(code_elem.get("class") or ()))
+                out.write(f"\n```{lang}\n{code_text}\n```\n\n")
             else:
-                lines.append(f"\n```\n{element.get_text()}\n```\n")
+                out.write(f"\n```\n{element.get_text()}\n```\n\n")
 
         elif tag_name == "code":
             # Inline code (not in pre)
             parent = element.parent
             if parent and parent.name != "pre":
                 text = element.get_text()
-                lines.append(f"`{text}`")
+                out.write(f"`{text}`\n")
 
         elif tag_name == "ul":
-            lines.append("")
+            out.write("\n")
             for li in element.find_all("li", recursive=False):
                 li_text = self._process_list_item(li)
-                lines.append(f"- {li_text}")
-            lines.append("")
+                out.write(f"- {li_text}\n")
+            out.write("\n")
 
         elif tag_name == "ol":
-            lines.append("")
+            out.write("\n")
             for i, li in enumerate(element.find_all("li", recursive=False), 1):
                 li_text = self._process_list_item(li)
-                lines.append(f"{i}. {li_text}")
-            lines.append("")
+                out.write(f"{i}. {li_text}\n")
+            out.write("\n")
 
         elif tag_name == "blockquote":
             text = self._get_text(element).strip()
             if text:
                 quoted = "\n".join(f"> {line}" for line in text.split("\n"))
-                lines.append(f"\n{quoted}\n")
+                out.write(f"\n{quoted}\n\n")
 
         elif tag_name == "table":
-            self._process_table(element, lines)
+            self._process_table(element, out)
 
         # Handle MkDocs admonitions (note, warning, tip, etc.)
         elif tag_name == "div" and element.get("class"):
             classes = element.get("class", [])
             if isinstance(classes, list) and "admonition" in classes:
-                self._process_admonition(element, lines)
+                self._process_admonition(element, out)
             else:
                 # Container elements - process children
                 for child in element.children:
-                    self._process_element(child, lines, depth + 1)
+                    self._process_element(child, out, depth + 1)
 
         elif tag_name == "a":
             # Check if this is a glightbox image link (MkDocs image lightbox)
@@ -247,7 +378,7 @@ class HTMLToMarkdownConverter:
                 # This is an image lightbox, process the image inside
                 img = element.find("img")
                 if img:
-                    self._process_image(img, lines)
+                    self._process_image(img, out)
                 return
 
             href = element.get("href", "")
@@ -261,50 +392,50 @@ class HTMLToMarkdownConverter:
             # Check if there's an image inside the link
             img = element.find("img")
             if img:
-                self._process_image(img, lines)
+                self._process_image(img, out)
                 return
 
             if href and text:
                 if not href.startswith(("http://", "https://", "#", "mailto:")):
                     href = urljoin(self.base_url, href)
-                lines.append(f"[{text}]({href})")
+                out.write(f"[{text}]({href})\n")
 
         elif tag_name == "br":
-            lines.append("\n")
+            out.write("\n\n")
 
         elif tag_name == "hr":
-            lines.append("\n---\n")
+            out.write("\n---\n\n")
 
         elif tag_name == "figure":
             # Handle figure elements which often contain images
             img = element.find("img")
             if img:
-                self._process_image(img, lines)
+                self._process_image(img, out)
             figcaption = element.find("figcaption")
             if figcaption:
                 caption = figcaption.get_text().strip()
                 if caption:
-                    lines.append(f"*{caption}*\n")
+                    out.write(f"*{caption}*\n\n")
 
         elif tag_name in ["section", "article", "main", "span", "aside"]:
             # Container elements - process children
             for child in element.children:
-                self._process_element(child, lines, depth + 1)
+                self._process_element(child, out, depth + 1)
 
         elif tag_name in ["strong", "b"]:
             text = self._get_text(element).strip()
             if text:
-                lines.append(f"**{text}**")
+                out.write(f"**{text}**\n")
 
         elif tag_name in ["em", "i"]:
             text = self._get_text(element).strip()
             if text:
-                lines.append(f"*{text}*")
+                out.write(f"*{text}*\n")
 
         else:
             # Process children for unknown elements
             for child in element.children:
-                self._process_element(child, lines, depth + 1)
+                self._process_element(child, out, depth + 1)
 
     def _inline_element(self, element: Tag) -> str:
         """Convert inline element to Markdown string."""
@@ -374,30 +505,37 @@ class HTMLToMarkdownConverter:
                 parts.append(self._inline_element(child))
         return " ".join(parts).strip()
 
-    def _process_table(self, table: Tag, lines: list) -> None:
+    def _process_table(self, table: Tag, out: io.StringIO) -> None:
         """Convert HTML table to Markdown table."""
-        lines.append("")
+        out.write("\n")
 
         rows = table.find_all("tr")
         if not rows:
             return
 
         # Process header row
-        header_row = rows[0]
-        headers = [th.get_text().strip() for th in header_row.find_all(["th", "td"])]
+        headers = self._table_cells(rows[0])
         if headers:
-            lines.append("| " + " | ".join(headers) + " |")
-            lines.append("| " + " | ".join(["---"] * len(headers)) + " |")
+            out.write("| " + " | ".join(headers) + " |\n")
+            out.write("| " + " | ".join(["---"] * len(headers)) + " |\n")
 
         # Process data rows
         for row in rows[1:]:
-            cells = [td.get_text().strip() for td in row.find_all(["td", "th"])]
+            cells = self._table_cells(row)
             if cells:
-                lines.append("| " + " | ".join(cells) + " |")
+                out.write("| " + " | ".join(cells) + " |\n")
+
+        out.write("\n")
 
-        lines.append("")
+    def _table_cells(self, row: Tag) -> list[str]:
+        """Get the text of a row's direct th/td cells (without descending into nested tables)."""
+        return [
+            cell.get_text().strip()
+            for cell in row.children
+            if getattr(cell, "name", None) in TABLE_CELL_TAGS
+        ]
 
-    def _process_admonition(self, element: Tag, lines: list) -> None:
+    def _process_admonition(self, element: Tag, out: io.StringIO) -> None:
         """Process MkDocs admonition (note, warning, tip, etc.)."""
         classes = element.get("class", [])
         admonition_type = "note"
@@ -437,11 +575,47 @@ class HTMLToMarkdownConverter:
         content = " ".join(content_parts)
 
         # Format as blockquote with title
-        lines.append(f"\n> **{title}**")
+        out.write(f"\n> **{title}**\n")
         for line in content.split("\n"):
             if line.strip():
-                lines.append(f"> {line.strip()}")
-        lines.append("")
+                out.write(f"> {line.strip()}\n")
+        out.write("\n")
+
+
+@functools.lru_cache(maxsize=8)
+def _get_converter(base_url: str, output_dir: str) -> HTMLToMarkdownConverter:
+    """Get the converter for a site, reused across pages within a worker process."""
+    return HTMLToMarkdownConverter(base_url, output_dir)
+
+
+def _parse_and_convert(
+    body: bytes, encoding: str | None, page_url: str, base_url: str, output_dir: str
+) -> tuple[str | None, list[tuple[str, str]]]:
+    """Extract a page's content and convert it to Markdown (runs in a worker process).
+
+    The raw body is decoded here rather than in the event loop, and the finished
+    Markdown is returned ready to write.
+
+    Returns the Markdown (None if no content was found, empty if the page has nothing
+    beyond its title) and the images to download as (url, local_path) pairs.
+    """
+    html = body.decode(encoding or "utf-8", errors="replace")
+    title, content = MkDocsScraper._extract_content(html)
+    if content is None:
+        return None, []
+
+    converter = _get_converter(base_url, output_dir)
+    markdown = converter.convert(content, page_url)
+
+    # Add title if not already in content
+    if title and not markdown.startswith(f"# {title}"):
+        markdown = f"# {title}\n\n{markdown}"
+
+    # Files with minimal content (just a title, no real content) are not worth saving
+    if len(TITLE_LINE_RE.sub("", markdown, count=1).strip()) < 10:
+        return "", []
+
+    return markdown, converter.images_to_download
 
 
 class MkDocsScraper:
@@ -458,14 +632,76 @@ class MkDocsScraper:
         self.base_path = parsed.path
 
         # URL tracking
-        self.urls_to_process: list[str] = []
-        self.downloaded_images: set[str] = set()
+        self.urls_to_visit: asyncio.Queue[str] = asyncio.Queue()
+        self.visited_urls: set[str] = set()
+        # Images are tracked by a short URL digest to keep memory flat on huge crawls
+        self.downloaded_images: set[bytes] = set()
+        # SHA-256 digests of fetched page bodies, to skip pages served under several URLs
+        self.page_hashes: set[bytes] = set()
+        self.existing_files: set[str] = set()
+        self.created_dirs: set[str] = set()
+
+        # Sitemap URL -> {etag, last_modified, is_index, locs}, persisted between runs
+        self.sitemap_cache: dict[str, dict] = {}
+        # Page URL -> {etag, last_modified} of the saved file, persisted between runs
+        self.page_cache: dict[str, dict] = {}
+
+        # Per-host semaphores for concurrency control, so images served from a CDN
+        # don't compete with page downloads for the same slots
+        self.host_semaphores: dict[str, asyncio.Semaphore] = {}
+        self.sitemap_semaphore = asyncio.Semaphore(SITEMAP_CONCURRENCY)
+
+        # Completed pages not yet shown on the progress bar, and when it was last updated
+        self.progress_pending = 0
+        self.progress_flushed = 0.0
+
+        # Process pool for CPU-bound HTML to Markdown conversion (set up in run)
+        self.pool: ProcessPoolExecutor | None = None
+
+    def _enqueue_urls(self, urls: list[str]) -> None:
+        """Queue newly discovered page URLs under base_url for download."""
+        base = self.base_url
+        visited = self.visited_urls
+        queue = self.urls_to_visit
+        existing = self.existing_files if self.config.skip_existing else None
+        new_urls = 0
+        skipped = 0
+        for url in urls:
+            if url.startswith(base) and url not in visited:
+                visited.add(url)
+                # Sitemaps and nav links can point at images and downloads, not pages
+                if os.path.splitext(urlparse(url).path)[1].lower() in ASSET_EXTENSIONS:
+                    continue
 
-        # Semaphore for concurrency control
-        self.semaphore = asyncio.Semaphore(config.concurrency)
+                # Skip existing files here, so they never wait on the queue or a worker
+                if existing:
+                    local_path = os.path.normpath(self._get_local_path(url))
+                    if local_path in existing:
+                        skipped += 1
+                        if self.config.verbose:
+                            console.print(f"[dim]Skipped (exists): {local_path}[/dim]")
+                        continue
 
-        # HTML to Markdown converter
-        self.converter = HTMLToMarkdownConverter(self.base_url, config.output_dir)
+                queue.put_nowait(url)
+                new_urls += 1
+        self.stats.discovered += new_urls + skipped
+        self.stats.skipped += skipped
+        self.progress_pending += skipped
+
+    def _host_semaphore(self, url: str) -> asyncio.Semaphore:
+        """Get the concurrency semaphore for the host serving a URL."""
+        host = urlparse(url).netloc
+        semaphore = self.host_semaphores.get(host)
+        if semaphore is None:
+            semaphore = self.host_semaphores[host] = asyncio.Semaphore(self.config.concurrency)
+        return semaphore
+
+    def _ensure_dir(self, path: str) -> None:
+        """Create a directory once, remembering it to skip repeated makedirs calls."""
+        if path in self.created_dirs:
+            return
+        os.makedirs(path, exist_ok=True)
+        self.created_dirs.add(path)
 
     def _get_local_path(self, url: str) -> str:
         """Convert URL to local file path."""
@@ -499,11 +735,15 @@ class MkDocsScraper:
 
     async def _download_image(self, client: httpx.AsyncClient, url: str, local_path: str) -> bool:
         """Download an image to local path."""
-        if url in self.downloaded_images:
+        image_key = _image_key(url)
+        if image_key in self.downloaded_images:
             return True
 
+        # Claim the URL up front so concurrent pages don't download it twice
+        self.downloaded_images.add(image_key)
+
         try:
-            async with self.semaphore:
+            async with self._host_semaphore(url):
                 response = await client.get(url, timeout=self.config.timeout)
 
             if response.status_code != 200:
@@ -511,17 +751,17 @@ class MkDocsScraper:
                     console.print(
                         f"[yellow]Failed to download image ({response.status_code}): {url}[/yellow]"
                     )
+                self.downloaded_images.discard(image_key)
                 self.stats.images_failed += 1
                 return False
 
             # Create directory if needed
-            os.makedirs(os.path.dirname(local_path), exist_ok=True)
+            self._ensure_dir(os.path.dirname(local_path))
 
             # Save image
-            with open(local_path, "wb") as f:
-                f.write(response.content)
+            async with aiofiles.open(local_path, "wb") as f:
+                await f.write(response.content)
 
-            self.downloaded_images.add(url)
             self.stats.images_downloaded += 1
 
             if self.config.verbose:
@@ -532,13 +772,12 @@ class MkDocsScraper:
         except Exception as e:
             if self.config.verbose:
                 console.print(f"[yellow]Error downloading image {url}: {e}[/yellow]")
+            self.downloaded_images.discard(image_key)
             self.stats.images_failed += 1
             return False
 
     async def _fetch_sitemap_urls(self, client: httpx.AsyncClient) -> list[str]:
         """Fetch all page URLs from MkDocs sitemap."""
-        urls = []
-
         # Try to fetch sitemap.xml
         sitemap_url = f"{self.base_url}/sitemap.xml"
 
@@ -550,45 +789,131 @@ class MkDocsScraper:
         if sitemap_url != parent_sitemap_url:
             sitemap_urls_to_try.append(parent_sitemap_url)
 
-        for smap_url in sitemap_urls_to_try:
-            try:
-                response = await client.get(smap_url, timeout=self.config.timeout)
-                if response.status_code != 200:
-                    if self.config.verbose:
-                        console.print(f"[dim]Could not fetch sitemap: {smap_url}[/dim]")
-                    continue
+        self.sitemap_cache = await self._load_cache(".sitemap_cache.json")
 
-                # Parse sitemap
-                root = ElementTree.fromstring(response.content)
+        # Fetch candidates in parallel, but keep their order of preference
+        results = await asyncio.gather(
+            *(self._fetch_sitemap(client, smap_url) for smap_url in sitemap_urls_to_try)
+        )
 
-                # Handle namespace
-                ns = {"sm": "http://www.sitemaps.org/schemas/sitemap/0.9"}
+        await self._save_cache(".sitemap_cache.json", self.sitemap_cache)
 
-                # Check if this is a sitemap index or urlset
-                if root.tag.endswith("sitemapindex"):
-                    # This is a sitemap index, fetch each child sitemap
-                    sitemap_locs = root.findall(".//sm:loc", ns)
-                    for loc in sitemap_locs:
-                        if loc.text:
-                            child_urls = await self._fetch_child_sitemap(client, loc.text)
-                            urls.extend(child_urls)
-                else:
-                    # This is a direct urlset
-                    loc_elements = root.findall(".//sm:loc", ns)
-                    for loc in loc_elements:
-                        if loc.text:
-                            urls.append(loc.text)
-
-                if urls:
-                    if self.config.verbose:
-                        console.print(
-                            f"[green]Found {len(urls)} URLs from sitemap: {smap_url}[/green]"
-                        )
-                    break
+        for smap_url, urls in zip(sitemap_urls_to_try, results, strict=True):
+            if urls:
+                if self.config.verbose:
+                    console.print(f"[green]Found {len(urls)} URLs from sitemap: {smap_url}[/green]")
+                return urls
 
-            except Exception as e:
+        return []
+
+    async def _load_cache(self, filename: str) -> dict[str, dict]:
+        """Load a cache of response validators saved in the output directory by a previous run."""
+        try:
+            path = os.path.join(self.config.output_dir, filename)
+            async with aiofiles.open(path, encoding="utf-8") as f:
+                return json.loads(await f.read())
+        except (OSError, ValueError):
+            return {}
+
+    async def _save_cache(self, filename: str, cache: dict[str, dict]) -> None:
+        """Persist a cache of response validators to the output directory for the next run."""
+        if not cache:
+            return
+
+        try:
+            path = os.path.join(self.config.output_dir, filename)
+            async with aiofiles.open(path, "w", encoding="utf-8") as f:
+                await f.write(json.dumps(cache))
+        except OSError as e:
+            if self.config.verbose:
+                console.print(f"[yellow]Could not save cache {filename}: {e}[/yellow]")
+
+    async def _get_sitemap_locs(
+        self, client: httpx.AsyncClient, sitemap_url: str
+    ) -> tuple[bool, list[str]] | None:
+        """Fetch and parse a sitemap, revalidating against the cache with a conditional GET.
+
+        Returns whether the sitemap is an index and its <loc> URLs, or None if it could not
+        be fetched.
+        """
+        cached = self.sitemap_cache.get(sitemap_url)
+        headers = _conditional_headers(cached)
+
+        async with (
+            self.sitemap_semaphore,
+            client.stream(
+                "GET", sitemap_url, headers=headers, timeout=self.config.timeout
+            ) as response,
+        ):
+            # Unchanged since the last run, reuse the parsed URLs
+            if response.status_code == 304 and cached:
+                if not cached["is_index"]:
+                    self._enqueue_urls(cached["locs"])
+                return cached["is_index"], cached["locs"]
+
+            if response.status_code != 200:
+                return None
+
+            # Parse while the body streams in, handing page URLs to the download
+            # workers as soon as they are seen
+            parser = SitemapParser()
+            async for chunk in response.aiter_bytes():
+                queued = len(parser.urls)
+                parser.feed(chunk)
+                if not parser.is_index:
+                    self._enqueue_urls(parser.urls[queued:])
+            is_index, locs = parser.close()
+            if not is_index:
+                self._enqueue_urls(locs)
+
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if etag or last_modified:
+            self.sitemap_cache[sitemap_url] = {
+                "etag": etag,
+                "last_modified": last_modified,
+                "is_index": is_index,
+                "locs": locs,
+            }
+
+        return is_index, locs
+
+    async def _fetch_sitemap(self, client: httpx.AsyncClient, smap_url: str) -> list[str]:
+        """Fetch URLs from a sitemap, expanding sitemap indexes."""
+        urls = []
+
+        try:
+            result = await self._get_sitemap_locs(client, smap_url)
+            if result is None:
                 if self.config.verbose:
-                    console.print(f"[yellow]Error fetching sitemap {smap_url}: {e}[/yellow]")
+                    console.print(f"[dim]Could not fetch sitemap: {smap_url}[/dim]")
+                return urls
+
+            is_index, locs = result
+
+            if is_index:
+                # This is a sitemap index, fetch child sitemaps through a sliding window
+                # rather than creating a task per child up front, since only
+                # SITEMAP_CONCURRENCY of them can be fetching at once anyway
+                pending_locs = iter(locs)
+                in_flight: set[asyncio.Task[list[str]]] = set()
+                while True:
+                    for loc in itertools.islice(pending_locs, SITEMAP_CONCURRENCY - len(in_flight)):
+                        in_flight.add(asyncio.create_task(self._fetch_child_sitemap(client, loc)))
+                    if not in_flight:
+                        break
+                    done, in_flight = await asyncio.wait(
+                        in_flight, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    for task in done:
+                        urls.extend(task.result())
+            else:
+                # This is a direct urlset
+                urls.extend(locs)
+
+        except Exception as e:
+            if self.config.verbose:
+                console.print(f"[yellow]Error fetching sitemap {smap_url}: {e}[/yellow]")
 
         return urls
 
@@ -597,17 +922,11 @@ class MkDocsScraper:
         urls = []
 
         try:
-            response = await client.get(sitemap_url, timeout=self.config.timeout)
-            if response.status_code != 200:
+            result = await self._get_sitemap_locs(client, sitemap_url)
+            if result is None:
                 return urls
 
-            root = ElementTree.fromstring(response.content)
-            ns = {"sm": "http://www.sitemaps.org/schemas/sitemap/0.9"}
-
-            loc_elements = root.findall(".//sm:loc", ns)
-            for loc in loc_elements:
-                if loc.text:
-                    urls.append(loc.text)
+            _, urls = result
 
             if self.config.verbose:
                 console.print(f"[dim]Found {len(urls)} URLs in {sitemap_url}[/dim]")
@@ -620,29 +939,22 @@ class MkDocsScraper:
 
     async def _extract_links_from_html(self, client: httpx.AsyncClient, url: str) -> list[str]:
         """Fallback: Extract internal links from HTML page navigation."""
-        links = []
+        links: list[str] = []
 
         try:
             response = await client.get(url, timeout=self.config.timeout)
             if response.status_code != 200:
                 return links
 
-            soup = BeautifulSoup(response.text, "html.parser")
+            # Only hrefs are needed here, so skip building a BeautifulSoup tree
+            tree = lxml_html.fromstring(response.content, parser=_html_parser(response.encoding))
 
             # MkDocs Material theme uses nav with class md-nav for sidebar
-            nav = soup.find("nav", class_="md-nav--primary")
-            if not nav:
-                nav = soup.find("nav", class_="md-nav")
-            if not nav:
-                nav = soup.find("nav")
-            if not nav:
-                nav = soup.find("aside")
-
-            search_area = nav if nav else soup
-
-            for a_tag in search_area.find_all("a", href=True):
-                href = a_tag["href"]
+            search_area = next(
+                (found[0] for xpath in NAV_XPATHS if (found := tree.xpath(xpath))), tree
+            )
 
+            for href in search_area.xpath(".//a/@href"):
                 # Skip external links, anchors, and javascript
                 if href.startswith(("http://", "https://")):
                     if self.base_host not in href:
@@ -669,9 +981,10 @@ class MkDocsScraper:
             if self.config.verbose:
                 console.print(f"[yellow]Failed to extract links from {url}: {e}[/yellow]")
 
-        return list(set(links))
+        return links
 
-    def _extract_content(self, html: str) -> tuple[str, Tag | None]:
+    @staticmethod
+    def _extract_content(html: str) -> tuple[str, Tag | None]:
         """Extract title and main content from HTML page."""
         soup = BeautifulSoup(html, "html.parser")
 
@@ -696,92 +1009,99 @@ class MkDocsScraper:
             main = soup.find("div", {"role": "main"})
 
         if main:
-            # Remove unwanted elements
-            for elem in main.find_all(["nav", "footer", "button"]):
-                elem.decompose()
-
-            # Remove edit links (common in MkDocs)
-            for elem in main.find_all("a", class_="md-content__button"):
-                elem.decompose()
-
-            # Remove "Last updated" metadata
-            for elem in main.find_all(["p", "div", "span", "small"]):
-                text = elem.get_text().lower()
-                if "last updated" in text or "last modified" in text:
-                    elem.decompose()
-
-            # Remove navigation footer (prev/next)
-            for elem in main.find_all(class_="md-footer-nav"):
-                elem.decompose()
-            for elem in main.find_all("nav", class_="md-footer__inner"):
-                elem.decompose()
-
-            # Remove copy buttons
-            for elem in main.find_all(attrs={"data-clipboard-target": True}):
-                elem.decompose()
-            for elem in main.find_all("button"):
-                elem.decompose()
+            # Remove navigation, edit/source links, copy buttons and "Last updated" metadata
+            # in a single walk (snapshot first, since we mutate the tree)
+            for elem in list(main.descendants):
+                if not isinstance(elem, Tag) or elem.decomposed:
+                    continue
 
-            # Remove source code links
-            for elem in main.find_all("a", class_="md-source"):
-                elem.decompose()
+                if (
+                    elem.name in REMOVE_TAGS
+                    or not REMOVE_CLASSES.isdisjoint(elem.get("class") or [])
+                    or elem.has_attr("data-clipboard-target")
+                    or (elem.name in METADATA_TAGS and _is_last_updated(elem))
+                ):
+                    elem.decompose()
 
         return title, main
 
-    async def _process_url(
-        self, client: httpx.AsyncClient, url: str, progress: Progress, task_id
-    ) -> bool:
+    async def _process_url(self, client: httpx.AsyncClient, url: str) -> bool:
         """Process a single URL: download HTML, convert to Markdown, download images, and save."""
         local_path = self._get_local_path(url)
 
-        # Skip if file exists and skip_existing is enabled
-        if self.config.skip_existing and os.path.exists(local_path):
-            self.stats.skipped += 1
-            if self.config.verbose:
-                console.print(f"[dim]Skipped (exists): {local_path}[/dim]")
-            progress.update(task_id, advance=1)
-            return True
+        # Revalidate pages saved by a previous run instead of downloading them again
+        cached = self.page_cache.get(url)
+        if cached and not await aiofiles.os.path.exists(local_path):
+            cached = None
 
         try:
-            async with self.semaphore:
-                response = await client.get(url, timeout=self.config.timeout)
+            async with self._host_semaphore(url):
+                response = await client.get(
+                    url, headers=_conditional_headers(cached), timeout=self.config.timeout
+                )
+
+            if response.status_code == 304 and cached:
+                self.stats.skipped += 1
+                if self.config.verbose:
+                    console.print(f"[dim]Skipped (not modified): {local_path}[/dim]")
+                return True
 
             if response.status_code != 200:
                 self.stats.failed += 1
                 if self.config.verbose:
                     console.print(f"[yellow]Failed ({response.status_code}): {url}[/yellow]")
-                progress.update(task_id, advance=1)
                 return False
 
-            # Extract content
-            title, content = self._extract_content(response.text)
-
-            if content:
-                # Convert to Markdown (this also collects images to download)
-                markdown = self.converter.convert(content, url)
-
-                # Download images
-                for img_url, img_local_path in self.converter.images_to_download:
-                    await self._download_image(client, img_url, img_local_path)
-
-                # Add title if not already in content
-                if title and not markdown.startswith(f"# {title}"):
-                    markdown = f"# {title}\n\n{markdown}"
-
-                # Skip files with minimal content (just a title, no real content)
-                content_without_title = re.sub(r"^#\s+[^\n]+\n*", "", markdown).strip()
-                if len(content_without_title) < 10:
-                    self.stats.skipped += 1
-                    if self.config.verbose:
-                        console.print(f"[dim]Skipped (no content): {local_path}[/dim]")
-                    progress.update(task_id, advance=1)
-                    return True
+            # Skip mirror pages (e.g. /foo and /foo/) before converting or fetching images
+            page_hash = hashlib.sha256(response.content).digest()
+            if page_hash in self.page_hashes:
+                self.stats.skipped += 1
+                if self.config.verbose:
+                    console.print(f"[dim]Skipped (duplicate content): {url}[/dim]")
+                return True
+            self.page_hashes.add(page_hash)
+
+            # Decode, extract content and convert to Markdown in a worker process, so
+            # pages are parsed on all cores while other downloads continue. The raw
+            # bytes are sent rather than a decoded str to avoid an extra copy here.
+            loop = asyncio.get_running_loop()
+            markdown, images = await loop.run_in_executor(
+                self.pool,
+                _parse_and_convert,
+                response.content,
+                response.encoding,
+                url,
+                self.base_url,
+                self.config.output_dir,
+            )
+
+            if markdown == "":
+                self.stats.skipped += 1
+                if self.config.verbose:
+                    console.print(f"[dim]Skipped (no content): {local_path}[/dim]")
+            elif markdown is not None:
+                # Download images concurrently, gated by the per-host semaphores
+                image_results = await asyncio.gather(
+                    *(
+                        self._download_image(client, img_url, img_local_path)
+                        for img_url, img_local_path in images
+                    )
+                )
 
                 # Create directory and save file
-                os.makedirs(os.path.dirname(local_path), exist_ok=True)
+                self._ensure_dir(os.path.dirname(local_path))
+
+                async with aiofiles.open(local_path, "w", encoding="utf-8") as f:
+                    await f.write(markdown)
 
-                with open(local_path, "w", encoding="utf-8") as f:
-                    f.write(markdown)
+                # Only remember validators when every image was saved; otherwise the next
+                # run would get a 304 for the page and never retry the missing images
+                etag = response.headers.get("ETag")
+                last_modified = response.headers.get("Last-Modified")
+                if all(image_results) and (etag or last_modified):
+                    self.page_cache[url] = {"etag": etag, "last_modified": last_modified}
+                else:
+                    self.page_cache.pop(url, None)
 
                 self.stats.downloaded += 1
                 if self.config.verbose:
@@ -796,9 +1116,31 @@ class MkDocsScraper:
             if self.config.verbose:
                 console.print(f"[red]Error processing {url}: {e}[/red]")
 
-        progress.update(task_id, advance=1)
         return True
 
+    async def _worker(self, client: httpx.AsyncClient, progress: Progress, task_id) -> None:
+        """Worker coroutine that processes URLs from the queue."""
+        while True:
+            url = await self.urls_to_visit.get()
+
+            try:
+                await self._process_url(client, url)
+            except Exception as e:
+                if self.config.verbose:
+                    console.print(f"[red]Error processing {url}: {e}[/red]")
+            finally:
+                self.urls_to_visit.task_done()
+                self.progress_pending += 1
+                if time.monotonic() - self.progress_flushed >= PROGRESS_INTERVAL:
+                    self._flush_progress(progress, task_id)
+
+    def _flush_progress(self, progress: Progress, task_id) -> None:
+        """Push buffered page completions to the progress bar in one update."""
+        # Discovery may still be running, keep the progress total in step
+        progress.update(task_id, total=self.stats.discovered, advance=self.progress_pending)
+        self.progress_pending = 0
+        self.progress_flushed = time.monotonic()
+
     async def run(self) -> ScraperStats:
         """Run the scraper."""
         console.print("[bold blue]MkDocs Scraper[/bold blue]")
@@ -810,64 +1152,99 @@ class MkDocsScraper:
         # Create output directory
         os.makedirs(self.config.output_dir, exist_ok=True)
 
-        async with httpx.AsyncClient(
-            follow_redirects=True,
-            headers={
-                "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
-            },
-        ) as client:
-            # Discover URLs from sitemap
-            console.print("[cyan]Discovering pages from sitemap...[/cyan]")
-            urls = await self._fetch_sitemap_urls(client)
-
-            # Filter URLs to only include those under base_url
-            urls = [u for u in urls if u.startswith(self.base_url)]
-
-            # Fallback to HTML crawling if no URLs found
-            if not urls:
-                console.print("[yellow]No sitemap found, falling back to HTML crawling...[/yellow]")
-                urls = await self._extract_links_from_html(client, self.base_url)
-                urls = list(set(urls))
-
-            # Always include base URL
-            if self.base_url not in urls and f"{self.base_url}/" not in urls:
-                urls.insert(0, self.base_url)
-
-            # Remove duplicates and sort
-            urls = sorted(set(urls))
-
-            self.stats.discovered = len(urls)
-            console.print(f"[green]Found {len(urls)} pages to download[/green]")
-            console.print()
-
-            if not urls:
-                console.print("[yellow]No pages found to download[/yellow]")
-                return self.stats
-
-            # Process all URLs
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                BarColumn(),
-                TaskProgressColumn(),
-                console=console,
-            ) as progress:
-                task_id = progress.add_task("[cyan]Downloading pages...", total=len(urls))
-
-                # Create tasks for all URLs
-                tasks = [self._process_url(client, url, progress, task_id) for url in urls]
-
-                # Run with concurrency limit (semaphore handles this)
-                await asyncio.gather(*tasks)
-
-        # Print summary
-        console.print()
-        console.print("[bold green]✓ Scraping complete![/bold green]")
-        console.print(f"  Discovered: {self.stats.discovered} pages")
-        console.print(f"  Downloaded: {self.stats.downloaded} files")
-        console.print(f"  Skipped: {self.stats.skipped} files")
-        console.print(f"  Failed: {self.stats.failed} pages")
-        console.print(f"  Images downloaded: {self.stats.images_downloaded}")
-        console.print(f"  Images failed: {self.stats.images_failed}")
+        # Index existing files once instead of stat-ing every page path
+        if self.config.skip_existing:
+            self.existing_files = {
+                os.path.normpath(os.path.join(root, name))
+                for root, _, files in os.walk(self.config.output_dir)
+                for name in files
+            }
+
+        self.page_cache = await self._load_cache(".page_cache.json")
+
+        # Keep the validators gathered so far even if the run fails or is interrupted
+        try:
+            async with httpx.AsyncClient(
+                follow_redirects=True,
+                headers={
+                    "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
+                },
+                # Keep one warm connection per worker so same-host pages reuse TLS sessions
+                limits=httpx.Limits(
+                    max_connections=self.config.concurrency * 2,
+                    max_keepalive_connections=self.config.concurrency,
+                    keepalive_expiry=30.0,
+                ),
+            ) as client:
+                # Download pages while they are still being discovered, converting them to
+                # Markdown in a process pool. At most one page per worker is converting at a
+                # time, so more processes than that would only add startup cost.
+                max_workers = min(self.config.concurrency, os.cpu_count() or 1)
+                with (
+                    ProcessPoolExecutor(
+                        max_workers=max_workers,
+                        mp_context=multiprocessing.get_context(POOL_START_METHOD),
+                    ) as self.pool,
+                    Progress(
+                        SpinnerColumn(),
+                        TextColumn("[progress.description]{task.description}"),
+                        BarColumn(),
+                        TaskProgressColumn(),
+                        console=console,
+                    ) as progress,
+                ):
+                    task_id = progress.add_task("[cyan]Downloading pages...", total=None)
+
+                    # Create workers
+                    workers = [
+                        asyncio.create_task(self._worker(client, progress, task_id))
+                        for _ in range(self.config.concurrency)
+                    ]
+
+                    # Discover URLs from sitemap (queued for download as they are parsed)
+                    console.print("[cyan]Discovering pages from sitemap...[/cyan]")
+                    await self._fetch_sitemap_urls(client)
+
+                    # Fallback to HTML crawling if no URLs found
+                    if not self.visited_urls:
+                        console.print(
+                            "[yellow]No sitemap found, falling back to HTML crawling...[/yellow]"
+                        )
+                        links = await self._extract_links_from_html(client, self.base_url)
+                        self._enqueue_urls(links)
+
+                    # Always include base URL
+                    if f"{self.base_url}/" not in self.visited_urls:
+                        self._enqueue_urls([self.base_url])
+
+                    console.print(f"[green]Found {self.stats.discovered} pages to download[/green]")
+                    self._flush_progress(progress, task_id)
+
+                    # Wait for queue to be fully processed
+                    await self.urls_to_visit.join()
+
+                    # Cancel workers
+                    for worker in workers:
+                        worker.cancel()
+
+                    # Wait for workers to finish
+                    await asyncio.gather(*workers, return_exceptions=True)
+                    self._flush_progress(progress, task_id)
+        finally:
+            await self._save_cache(".page_cache.json", self.page_cache)
+
+        # Print summary, as JSON when output is not a terminal (e.g. CI logs)
+        if console.is_terminal:
+            console.print(
+                "\n[bold green]✓ Scraping complete![/bold green]\n"
+                f"  Discovered: {self.stats.discovered} pages\n"
+                f"  Downloaded: {self.stats.downloaded} files\n"
+                f"  Skipped: {self.stats.skipped} files\n"
+                f"  Failed: {self.stats.failed} pages\n"
+                f"  Images downloaded: {self.stats.images_downloaded}\n"
+                f"  Images failed: {self.stats.images_failed}"
+            )
+        else:
+            sys.stdout.write(json.dumps(asdict(self.stats)) + "\n")
 
         return self.stats
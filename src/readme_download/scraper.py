@@ -1,19 +1,73 @@
 """Core scraper module for ReadMe.com documentation sites."""
 
 import asyncio
+import functools
 import hashlib
+import io
 import os
 import re
+from collections.abc import Callable
 from dataclasses import dataclass
 from urllib.parse import urljoin, urlparse
 
+import aiofiles
+import aiofiles.os
 import httpx
-from bs4 import BeautifulSoup, NavigableString, Tag
+from bs4 import BeautifulSoup, NavigableString, SoupStrainer, Tag
+from lxml import html as lxml_html
 from rich.console import Console
 from rich.progress import BarColumn, Progress, SpinnerColumn, TaskProgressColumn, TextColumn
 
 console = Console()
 
+# Read size when streaming images to disk
+IMAGE_CHUNK_SIZE = 64 * 1024
+
+# Elements a page's title and content are taken from; everything else is skipped while parsing
+CONTENT_STRAINER = SoupStrainer(["title", "h1", "article", "main"])
+
+# Elements dropped from the content without converting their children
+SKIP_TAGS = frozenset({"script", "style", "nav", "aside", "footer", "svg"})
+
+HEADING_TAGS = frozenset({"h1", "h2", "h3", "h4", "h5", "h6"})
+BOLD_TAGS = frozenset({"strong", "b"})
+EMPHASIS_TAGS = frozenset({"em", "i"})
+LIST_TAGS = frozenset({"ul", "ol"})
+
+# Inline tags whose Markdown form is just their text
+PLAIN_INLINE_TAGS = frozenset({"span"})
+
+# Labels of interactive buttons (copy, feedback, ...) dropped instead of kept as text
+BUTTON_LABELS = frozenset(
+    {"Copy", "Copy to clipboard", "Copy Code", "Try It!", "Show full URL", "Yes", "No"}
+)
+# The content extractor also drops the response panel toggle
+CONTENT_BUTTON_LABELS = BUTTON_LABELS | {"RESPONSE"}
+
+# Patterns used on every page, compiled once
+BLANK_LINES_RE = re.compile(r"\n{4,}")
+TRAILING_SPACE_RE = re.compile(r"[^\S\n]+$", re.MULTILINE)
+SKIP_LINK_RE = re.compile(r"^Skip link to\s*")
+TITLE_LINE_RE = re.compile(r"^#\s+[^\n]+\n*")
+
+# Text markers of ReadMe page chrome removed from the main content
+DID_THIS_HELP_RE = re.compile(r"Did this page help you")
+UPDATED_AGO_RE = re.compile(r"Updated\s+.*ago")
+RECENT_REQUESTS_RE = re.compile(r"Recent Requests")
+LANGUAGE_RE = re.compile(r"^LANGUAGE$")
+TRY_IT_RE = re.compile(r"Try It!")
+LOG_IN_RE = re.compile(r"Log in to see")
+
+# Any of the markers, to find them all in a single walk of the content
+PAGE_CHROME_PATTERNS = (
+    DID_THIS_HELP_RE,
+    UPDATED_AGO_RE,
+    RECENT_REQUESTS_RE,
+    LANGUAGE_RE,
+    LOG_IN_RE,
+)
+PAGE_CHROME_RE = re.compile("|".join(f"(?:{p.pattern})" for p in PAGE_CHROME_PATTERNS))
+
 
 @dataclass
 class ScraperConfig:
@@ -39,36 +93,83 @@ class ScraperStats:
     images_failed: int = 0
 
 
+@functools.lru_cache(maxsize=8)
+def _html_parser(encoding: str) -> lxml_html.HTMLParser:
+    """Get a reusable lxml HTML parser that decodes with the response's known charset."""
+    return lxml_html.HTMLParser(encoding=encoding)
+
+
+@functools.lru_cache(maxsize=4096)
+def _resolve_url(base: str, url: str) -> str:
+    """Resolve a link against a base URL; pages repeat the same nav and asset links."""
+    return urljoin(base, url)
+
+
+@functools.lru_cache(maxsize=4096)
+def _normalize_link(url: str) -> str:
+    """Drop the query, anchor and trailing slash from a discovered link."""
+    parsed = urlparse(url)
+    return f"{parsed.scheme}://{parsed.netloc}{parsed.path}".rstrip("/")
+
+
+class PageMarkdown(io.StringIO):
+    """Markdown buffer for one page, with the page URL and the images it references."""
+
+    def __init__(self, page_url: str):
+        super().__init__()
+        self.page_url = page_url
+        self.images: dict[str, str] = {}  # url -> local_path
+
+
 class HTMLToMarkdownConverter:
     """Convert HTML content to Markdown format."""
 
     def __init__(self, base_url: str, output_dir: str):
         self.base_url = base_url
         self.output_dir = output_dir
-        self.images_to_download: list[tuple[str, str]] = []  # (url, local_path)
-        self.current_page_url = ""
 
-    def convert(self, element: Tag, page_url: str) -> str:
-        """Convert BeautifulSoup element to Markdown."""
+        # Tag name -> converter; tags without an entry have their children processed
+        self._handlers: dict[str, Callable[[Tag, PageMarkdown], None]] = {
+            "button": self._process_button,
+            "img": self._process_image,
+            **dict.fromkeys(HEADING_TAGS, self._process_heading),
+            "p": self._process_paragraph,
+            "pre": self._process_pre,
+            "code": self._process_code,
+            "ul": self._process_unordered_list,
+            "ol": self._process_ordered_list,
+            "blockquote": self._process_blockquote,
+            "table": self._process_table,
+            "a": self._process_link,
+            "br": self._process_line_break,
+            "hr": self._process_rule,
+            "figure": self._process_figure,
+            **dict.fromkeys(BOLD_TAGS, self._process_strong),
+            **dict.fromkeys(EMPHASIS_TAGS, self._process_emphasis),
+        }
+
+    def convert(self, element: Tag, page_url: str) -> tuple[str, dict[str, str]]:
+        """Convert BeautifulSoup element to Markdown.
+
+        Returns the Markdown and the images to download (url -> local path). All
+        per-page state lives in the page's buffer, so one converter can serve
+        concurrent pages.
+        """
         if element is None:
-            return ""
+            return "", {}
 
-        self.images_to_download = []
-        self.current_page_url = page_url
-
-        lines: list[str] = []
-        self._process_element(element, lines, depth=0)
-
-        # Join lines and clean up
-        markdown = "\n".join(lines)
+        # Write Markdown blocks (one per line) into a single growable buffer
+        out = PageMarkdown(page_url)
+        self._process_element(element, out, depth=0)
+        markdown = out.getvalue()
 
         # Clean up excessive newlines
-        markdown = re.sub(r"\n{4,}", "\n\n\n", markdown)
+        markdown = BLANK_LINES_RE.sub("\n\n\n", markdown)
 
         # Remove trailing whitespace from each line
-        markdown = "\n".join(line.rstrip() for line in markdown.split("\n"))
+        markdown = TRAILING_SPACE_RE.sub("", markdown)
 
-        return markdown.strip()
+        return markdown.strip(), out.images
 
     def _get_text(self, element: Tag | NavigableString) -> str:
         """Get text content from element."""
@@ -76,7 +177,9 @@ class HTMLToMarkdownConverter:
             return str(element)
         return element.get_text()
 
-    def _get_image_local_path(self, img_url: str) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _get_image_local_path(img_url: str) -> str:
         """Get local path for an image URL."""
         parsed = urlparse(img_url)
         path = parsed.path
@@ -84,8 +187,8 @@ class HTMLToMarkdownConverter:
         # Get the filename from the path
         filename = os.path.basename(path)
         if not filename or "." not in filename:
-            # Generate a filename from URL hash
-            url_hash = hashlib.md5(img_url.encode()).hexdigest()[:8]
+            # Generate a filename from URL hash (a 4-byte BLAKE2b digest is 8 hex chars)
+            url_hash = hashlib.blake2b(img_url.encode(), digest_size=4).hexdigest()
             ext = ".png"
             # Try to get extension from content-type or URL
             if "." in path:
@@ -95,7 +198,7 @@ class HTMLToMarkdownConverter:
         # Put images in an 'img' subdirectory
         return f"img/{filename}"
 
-    def _process_image(self, element: Tag, lines: list) -> None:
+    def _process_image(self, element: Tag, out: PageMarkdown) -> None:
         """Process an image element."""
         src = element.get("src", "")
         alt = element.get("alt", "")
@@ -105,7 +208,7 @@ class HTMLToMarkdownConverter:
 
         # Make absolute URL
         if not src.startswith(("http://", "https://", "data:")):
-            src = urljoin(self.current_page_url, src)
+            src = _resolve_url(out.page_url, src)
 
         # Skip data URLs
         if src.startswith("data:"):
@@ -116,20 +219,19 @@ class HTMLToMarkdownConverter:
         full_local_path = os.path.join(self.output_dir, local_img_path)
 
         # Add to download queue
-        self.images_to_download.append((src, full_local_path))
+        out.images[src] = full_local_path
 
         # Use the relative path from output_dir
-        lines.append(f"\n![{alt}]({local_img_path})\n")
+        out.write(f"\n![{alt}]({local_img_path})\n\n")
 
-    def _process_element(self, element: Tag | NavigableString, lines: list, depth: int = 0) -> None:
+    def _process_element(
+        self, element: Tag | NavigableString, out: PageMarkdown, depth: int = 0
+    ) -> None:
         """Process an HTML element and convert to Markdown."""
         if isinstance(element, NavigableString):
             text = str(element).strip()
             if text:
-                if lines and not lines[-1].endswith("\n"):
-                    lines.append(text)
-                else:
-                    lines.append(text)
+                out.write(f"{text}\n")
             return
 
         if not isinstance(element, Tag):
@@ -138,154 +240,148 @@ class HTMLToMarkdownConverter:
         tag_name = element.name.lower() if element.name else ""
 
         # Skip unwanted elements
-        if tag_name in ["script", "style", "nav", "aside", "footer", "svg"]:
-            return
-
-        # Skip button elements but preserve code inside them
-        if tag_name == "button":
-            # Check if button contains useful text (not just icons)
-            text = self._get_text(element).strip()
-            if text and text not in [
-                "Copy",
-                "Copy to clipboard",
-                "Copy Code",
-                "Try It!",
-                "Show full URL",
-                "Yes",
-                "No",
-            ]:
-                lines.append(text)
+        if tag_name in SKIP_TAGS:
             return
 
-        # Handle images
-        if tag_name == "img":
-            self._process_image(element, lines)
-            return
-
-        # Handle different tags
-        if tag_name in ["h1", "h2", "h3", "h4", "h5", "h6"]:
-            level = int(tag_name[1])
-            # Remove anchor links before getting text
-            for anchor in element.find_all("a"):
-                anchor.decompose()
-            text = self._get_text(element).strip()
-            if text:
-                # Remove "Skip link to" prefix
-                text = re.sub(r"^Skip link to\s*", "", text)
-                lines.append(f"\n{'#' * level} {text}\n")
-
-        elif tag_name == "p":
+        handler = self._handlers.get(tag_name)
+        if handler:
+            handler(element, out)
+        else:
+            # Container and unknown elements - process children
+            for child in element.children:
+                self._process_element(child, out, depth + 1)
+
+    def _process_button(self, element: Tag, out: PageMarkdown) -> None:
+        """Skip button elements but preserve meaningful text inside them."""
+        # Check if button contains useful text (not just icons)
+        text = self._get_text(element).strip()
+        if text and text not in BUTTON_LABELS:
+            out.write(f"{text}\n")
+
+    def _process_heading(self, element: Tag, out: PageMarkdown) -> None:
+        """Convert an h1-h6 heading."""
+        level = int(element.name[1])
+        # Remove anchor links before getting text
+        for anchor in element.find_all("a"):
+            anchor.decompose()
+        text = self._get_text(element).strip()
+        if text:
+            # Remove "Skip link to" prefix
+            text = SKIP_LINK_RE.sub("", text)
+            out.write(f"\n{'#' * level} {text}\n\n")
+
+    def _process_paragraph(self, element: Tag, out: PageMarkdown) -> None:
+        """Convert a paragraph, keeping inline formatting."""
+        if all(child.name is None or child.name in PLAIN_INLINE_TAGS for child in element.children):
+            # Text-only paragraph: a single get_text() walk is enough
+            text = element.get_text().strip()
+        else:
             text_parts = []
             for child in element.children:
                 if isinstance(child, NavigableString):
                     text_parts.append(str(child))
                 elif isinstance(child, Tag):
-                    text_parts.append(self._inline_element(child))
+                    text_parts.append(self._inline_element(child, out))
             text = "".join(text_parts).strip()
-            if text:
-                lines.append(f"\n{text}\n")
-
-        elif tag_name == "pre":
-            # Code block
-            code_elem = element.find("code")
-            if code_elem:
-                code_text = code_elem.get_text()
-                # Try to detect language from class
-                classes = code_elem.get("class", [])
-                lang = ""
-                for cls in classes:
-                    if isinstance(cls, str) and cls.startswith("language-"):
-                        lang = cls.replace("language-", "")
-                        break
-                lines.append(f"\n```{lang}\n{code_text}\n```\n")
-            else:
-                lines.append(f"\n```\n{element.get_text()}\n```\n")
-
-        elif tag_name == "code":
-            # Inline code (not in pre)
-            parent = element.parent
-            if parent and parent.name != "pre":
-                text = element.get_text()
-                lines.append(f"`{text}`")
-
-        elif tag_name == "ul":
-            lines.append("")
-            for li in element.find_all("li", recursive=False):
-                li_text = self._process_list_item(li)
-                lines.append(f"- {li_text}")
-            lines.append("")
-
-        elif tag_name == "ol":
-            lines.append("")
-            for i, li in enumerate(element.find_all("li", recursive=False), 1):
-                li_text = self._process_list_item(li)
-                lines.append(f"{i}. {li_text}")
-            lines.append("")
-
-        elif tag_name == "blockquote":
-            text = self._get_text(element).strip()
-            if text:
-                quoted = "\n".join(f"> {line}" for line in text.split("\n"))
-                lines.append(f"\n{quoted}\n")
-
-        elif tag_name == "table":
-            self._process_table(element, lines)
-
-        elif tag_name == "a":
-            # Check if there's an image inside the link
-            img = element.find("img")
-            if img:
-                self._process_image(img, lines)
-                return
-
-            href = element.get("href", "")
-            text = self._get_text(element).strip()
-            # Skip navigation links
-            if "Previous" in text or "Next" in text:
-                return
-            if href and text:
-                if not href.startswith(("http://", "https://", "#", "mailto:")):
-                    href = urljoin(self.base_url, href)
-                lines.append(f"[{text}]({href})")
-
-        elif tag_name == "br":
-            lines.append("\n")
-
-        elif tag_name == "hr":
-            lines.append("\n---\n")
-
-        elif tag_name == "figure":
-            # Handle figure elements which often contain images
-            img = element.find("img")
-            if img:
-                self._process_image(img, lines)
-            figcaption = element.find("figcaption")
-            if figcaption:
-                caption = figcaption.get_text().strip()
-                if caption:
-                    lines.append(f"*{caption}*\n")
-
-        elif tag_name in ["div", "section", "article", "main", "span"]:
-            # Container elements - process children
-            for child in element.children:
-                self._process_element(child, lines, depth + 1)
-
-        elif tag_name in ["strong", "b"]:
-            text = self._get_text(element).strip()
-            if text:
-                lines.append(f"**{text}**")
-
-        elif tag_name in ["em", "i"]:
-            text = self._get_text(element).strip()
-            if text:
-                lines.append(f"*{text}*")
-
+        if text:
+            out.write(f"\n{text}\n\n")
+
+    def _process_pre(self, element: Tag, out: PageMarkdown) -> None:
+        """Convert a code block."""
+        code_elem = element.find("code")
+        if code_elem:
+            code_text = code_elem.get_text()
+            # Try to detect language from class
+            classes = code_elem.get("class", [])
+            lang = ""
+            for cls in classes:
+                if isinstance(cls, str) and cls.startswith("language-"):
+                    lang = cls.replace("language-", "")
+                    break
+            out.write(f"\n```{lang}\n{code_text}\n```\n\n")
         else:
-            # Process children for unknown elements
-            for child in element.children:
-                self._process_element(child, lines, depth + 1)
+            out.write(f"\n```\n{element.get_text()}\n```\n\n")
+
+    def _process_code(self, element: Tag, out: PageMarkdown) -> None:
+        """Convert inline code (not in pre)."""
+        parent = element.parent
+        if parent and parent.name != "pre":
+            text = element.get_text()
+            out.write(f"`{text}`\n")
+
+    def _process_unordered_list(self, element: Tag, out: PageMarkdown) -> None:
+        """Convert a bulleted list."""
+        out.write("\n")
+        for li in element.find_all("li", recursive=False):
+            li_text = self._process_list_item(li, out)
+            out.write(f"- {li_text}\n")
+        out.write("\n")
+
+    def _process_ordered_list(self, element: Tag, out: PageMarkdown) -> None:
+        """Convert a numbered list."""
+        out.write("\n")
+        for i, li in enumerate(element.find_all("li", recursive=False), 1):
+            li_text = self._process_list_item(li, out)
+            out.write(f"{i}. {li_text}\n")
+        out.write("\n")
+
+    def _process_blockquote(self, element: Tag, out: PageMarkdown) -> None:
+        """Convert a blockquote."""
+        text = self._get_text(element).strip()
+        if text:
+            quoted = "\n".join(f"> {line}" for line in text.split("\n"))
+            out.write(f"\n{quoted}\n\n")
+
+    def _process_link(self, element: Tag, out: PageMarkdown) -> None:
+        """Convert a link, or the image inside it."""
+        # Check if there's an image inside the link
+        img = element.find("img")
+        if img:
+            self._process_image(img, out)
+            return
 
-    def _inline_element(self, element: Tag) -> str:
+        href = element.get("href", "")
+        text = self._get_text(element).strip()
+        # Skip navigation links
+        if "Previous" in text or "Next" in text:
+            return
+        if href and text:
+            if not href.startswith(("http://", "https://", "#", "mailto:")):
+                href = _resolve_url(self.base_url, href)
+            out.write(f"[{text}]({href})\n")
+
+    def _process_line_break(self, element: Tag, out: PageMarkdown) -> None:
+        """Convert a line break."""
+        out.write("\n\n")
+
+    def _process_rule(self, element: Tag, out: PageMarkdown) -> None:
+        """Convert a horizontal rule."""
+        out.write("\n---\n\n")
+
+    def _process_figure(self, element: Tag, out: PageMarkdown) -> None:
+        """Convert figure elements, which often contain images."""
+        img = element.find("img")
+        if img:
+            self._process_image(img, out)
+        figcaption = element.find("figcaption")
+        if figcaption:
+            caption = figcaption.get_text().strip()
+            if caption:
+                out.write(f"*{caption}*\n\n")
+
+    def _process_strong(self, element: Tag, out: PageMarkdown) -> None:
+        """Convert bold text."""
+        text = self._get_text(element).strip()
+        if text:
+            out.write(f"**{text}**\n")
+
+    def _process_emphasis(self, element: Tag, out: PageMarkdown) -> None:
+        """Convert italic text."""
+        text = self._get_text(element).strip()
+        if text:
+            out.write(f"*{text}*\n")
+
+    def _inline_element(self, element: Tag, out: PageMarkdown) -> str:
         """Convert inline element to Markdown string."""
         if isinstance(element, NavigableString):
             return str(element)
@@ -294,60 +390,60 @@ class HTMLToMarkdownConverter:
 
         if tag_name == "code":
             return f"`{element.get_text()}`"
-        elif tag_name in ["strong", "b"]:
+        elif tag_name in BOLD_TAGS:
             return f"**{element.get_text()}**"
-        elif tag_name in ["em", "i"]:
+        elif tag_name in EMPHASIS_TAGS:
             return f"*{element.get_text()}*"
         elif tag_name == "a":
             # Check if there's an image inside the link
             img = element.find("img")
             if img:
-                return self._inline_image(img)
+                return self._inline_image(img, out)
 
             href = element.get("href", "")
             text = element.get_text().strip()
             if href and text:
                 if not href.startswith(("http://", "https://", "#", "mailto:")):
-                    href = urljoin(self.base_url, href)
+                    href = _resolve_url(self.base_url, href)
                 return f"[{text}]({href})"
             return text
         elif tag_name == "br":
             return "\n"
         elif tag_name == "img":
-            return self._inline_image(element)
+            return self._inline_image(element, out)
         else:
             return element.get_text()
 
-    def _inline_image(self, element: Tag) -> str:
+    def _inline_image(self, element: Tag, out: PageMarkdown) -> str:
         """Process an image element and return Markdown string."""
         src = element.get("src", "")
         alt = element.get("alt", "")
         if src:
             if not src.startswith(("http://", "https://", "data:")):
-                src = urljoin(self.current_page_url, src)
+                src = _resolve_url(out.page_url, src)
             if not src.startswith("data:"):
                 local_img_path = self._get_image_local_path(src)
                 full_local_path = os.path.join(self.output_dir, local_img_path)
-                self.images_to_download.append((src, full_local_path))
+                out.images[src] = full_local_path
                 return f"![{alt}]({local_img_path})"
         return ""
 
-    def _process_list_item(self, li: Tag) -> str:
+    def _process_list_item(self, li: Tag, out: PageMarkdown) -> str:
         """Process a list item and return its text content."""
         parts = []
         for child in li.children:
             if isinstance(child, NavigableString):
                 parts.append(str(child).strip())
             elif isinstance(child, Tag):
-                if child.name in ["ul", "ol"]:
+                if child.name in LIST_TAGS:
                     # Nested list - skip for now
                     continue
-                parts.append(self._inline_element(child))
+                parts.append(self._inline_element(child, out))
         return " ".join(parts).strip()
 
-    def _process_table(self, table: Tag, lines: list) -> None:
+    def _process_table(self, table: Tag, out: PageMarkdown) -> None:
         """Convert HTML table to Markdown table."""
-        lines.append("")
+        out.write("\n")
 
         rows = table.find_all("tr")
         if not rows:
@@ -357,16 +453,16 @@ class HTMLToMarkdownConverter:
         header_row = rows[0]
         headers = [th.get_text().strip() for th in header_row.find_all(["th", "td"])]
         if headers:
-            lines.append("| " + " | ".join(headers) + " |")
-            lines.append("| " + " | ".join(["---"] * len(headers)) + " |")
+            out.write(f"| {' | '.join(headers)} |\n")
+            out.write(f"| {' | '.join(['---'] * len(headers))} |\n")
 
         # Process data rows
         for row in rows[1:]:
             cells = [td.get_text().strip() for td in row.find_all(["td", "th"])]
             if cells:
-                lines.append("| " + " | ".join(cells) + " |")
+                out.write(f"| {' | '.join(cells)} |\n")
 
-        lines.append("")
+        out.write("\n")
 
 
 class ReadMeScraper:
@@ -382,21 +478,24 @@ class ReadMeScraper:
         self.base_host = parsed.netloc
         self.base_path = parsed.path
 
+        # Prefix of every output file path ("out/" for "out" or "out/")
+        self.output_prefix = os.path.join(config.output_dir, "")
+
         # URL tracking
         self.urls_to_process: list[str] = []
         self.downloaded_images: set[str] = set()
+        self.downloaded_image_paths: set[str] = set()
         self.discovered_urls: set[str] = set()
-
-        # Semaphore for concurrency control
-        self.semaphore = asyncio.Semaphore(config.concurrency)
+        self.created_dirs: set[str] = set()
 
         # HTML to Markdown converter
         self.converter = HTMLToMarkdownConverter(self.base_url, config.output_dir)
 
     def _get_local_path(self, url: str) -> str:
         """Convert URL to local file path."""
-        parsed = urlparse(url)
-        path = parsed.path
+        # Path part of the URL: drop the scheme and host, then any query or anchor
+        path = url.partition("://")[2].partition("/")[2]
+        path = "/" + path.partition("?")[0].partition("#")[0]
 
         # Remove base path prefix to get relative path
         if path.startswith(self.base_path):
@@ -412,40 +511,50 @@ class ReadMeScraper:
         if relative_path.endswith("/"):
             relative_path = relative_path.rstrip("/")
 
-        # Build full path
-        file_path = os.path.join(self.config.output_dir, relative_path)
-
-        # Add .md extension
-        if not file_path.endswith(".md"):
-            file_path += ".md"
+        # Build full path with the .md extension
+        if relative_path.endswith(".md"):
+            return f"{self.output_prefix}{relative_path}"
+        return f"{self.output_prefix}{relative_path}.md"
 
-        return file_path
+    async def _ensure_dir(self, path: str) -> None:
+        """Create a directory once, remembering it to skip repeated makedirs calls."""
+        if path in self.created_dirs:
+            return
+        await aiofiles.os.makedirs(path, exist_ok=True)
+        self.created_dirs.add(path)
 
     async def _download_image(self, client: httpx.AsyncClient, url: str, local_path: str) -> bool:
         """Download an image to local path."""
-        if url in self.downloaded_images:
+        # Images are saved flat under img/, so different URLs can share a file; the first
+        # URL to claim a local path wins
+        if url in self.downloaded_images or local_path in self.downloaded_image_paths:
             return True
 
-        try:
-            async with self.semaphore:
-                response = await client.get(url, timeout=self.config.timeout)
-
-            if response.status_code != 200:
-                if self.config.verbose:
-                    console.print(
-                        f"[yellow]Failed to download image ({response.status_code}): {url}[/yellow]"
-                    )
-                self.stats.images_failed += 1
-                return False
-
-            # Create directory if needed
-            os.makedirs(os.path.dirname(local_path), exist_ok=True)
+        # Claim the URL and the file up front so concurrent downloads don't stream into
+        # the same file
+        self.downloaded_images.add(url)
+        self.downloaded_image_paths.add(local_path)
 
-            # Save image
-            with open(local_path, "wb") as f:
-                f.write(response.content)
+        try:
+            async with client.stream("GET", url) as response:
+                if response.status_code != 200:
+                    if self.config.verbose:
+                        console.print(
+                            f"[yellow]Failed to download image ({response.status_code}): {url}[/yellow]"
+                        )
+                    self.downloaded_images.discard(url)
+                    self.downloaded_image_paths.discard(local_path)
+                    self.stats.images_failed += 1
+                    return False
+
+                # Create directory if needed
+                await self._ensure_dir(os.path.dirname(local_path))
+
+                # Save image chunk by chunk instead of buffering it whole in memory
+                async with aiofiles.open(local_path, "wb") as f:
+                    async for chunk in response.aiter_bytes(IMAGE_CHUNK_SIZE):
+                        await f.write(chunk)
 
-            self.downloaded_images.add(url)
             self.stats.images_downloaded += 1
 
             if self.config.verbose:
@@ -456,6 +565,8 @@ class ReadMeScraper:
         except Exception as e:
             if self.config.verbose:
                 console.print(f"[yellow]Error downloading image {url}: {e}[/yellow]")
+            self.downloaded_images.discard(url)
+            self.downloaded_image_paths.discard(local_path)
             self.stats.images_failed += 1
             return False
 
@@ -464,87 +575,79 @@ class ReadMeScraper:
         links = []
 
         try:
-            response = await client.get(url, timeout=self.config.timeout)
+            response = await client.get(url)
             if response.status_code != 200:
                 return links
 
-            soup = BeautifulSoup(response.text, "html.parser")
+            # Only hrefs are needed here, so query them with XPath instead of BeautifulSoup
+            tree = lxml_html.fromstring(response.content, parser=_html_parser(response.encoding))
 
             # Find sidebar navigation (ReadMe uses nav elements with specific structure)
-            nav_elements = soup.find_all("nav")
-
-            for nav in nav_elements:
-                for a_tag in nav.find_all("a", href=True):
-                    href = a_tag["href"]
-
-                    # Skip external links, anchors, and non-doc links
-                    if href.startswith(("http://", "https://")):
-                        if self.base_host not in href:
-                            continue
-                        # Check if it's under the same reference path
-                        parsed_href = urlparse(href)
-                        if self.base_path in parsed_href.path or "/reference" in parsed_href.path:
-                            links.append(href)
-                    elif href.startswith(("#", "javascript:", "mailto:", "tel:")):
+            for href in tree.xpath("//nav//a/@href"):
+                # Skip external links, anchors, and non-doc links
+                if href.startswith(("http://", "https://")):
+                    if self.base_host not in href:
                         continue
-                    elif href.startswith("/"):
-                        # Only include paths that are reference docs
-                        if "/reference" in href or self.base_path in href:
-                            full_url = f"https://{self.base_host}{href}"
-                            links.append(full_url)
+                    # Check if it's under the same reference path
+                    parsed_href = urlparse(href)
+                    if self.base_path in parsed_href.path or "/reference" in parsed_href.path:
+                        links.append(_normalize_link(str(href)))  # Not tied to the parsed tree
+                elif href.startswith(("#", "javascript:", "mailto:", "tel:")):
+                    continue
+                elif href.startswith("/"):
+                    # Only include paths that are reference docs
+                    if "/reference" in href or self.base_path in href:
+                        links.append(_normalize_link(f"https://{self.base_host}{href}"))
 
             # Also check for links in the main content area
-            main = soup.find("main")
-            if main:
-                for a_tag in main.find_all("a", href=True):
-                    href = a_tag["href"]
-                    if href.startswith("/reference"):
-                        full_url = f"https://{self.base_host}{href}"
-                        if full_url not in links:
-                            links.append(full_url)
+            for href in tree.xpath("(//main)[1]//a/@href"):
+                if href.startswith("/reference"):
+                    links.append(_normalize_link(f"https://{self.base_host}{href}"))
 
         except Exception as e:
             if self.config.verbose:
                 console.print(f"[yellow]Failed to extract links from {url}: {e}[/yellow]")
 
-        return list(set(links))
+        # Deduplicate, keeping the order links appear in on the page
+        return list(dict.fromkeys(links))
 
     async def _discover_all_links(self, client: httpx.AsyncClient) -> list[str]:
         """Recursively discover all links from the documentation site."""
+        # Breadth-first, one level at a time: pages in the same level are fetched
+        # concurrently, so discovery takes one round trip per level rather than per page
         urls_to_visit = [self.base_url]
         all_urls = set()
 
         while urls_to_visit:
-            current_url = urls_to_visit.pop(0)
-
-            if current_url in self.discovered_urls:
-                continue
-
-            self.discovered_urls.add(current_url)
-            all_urls.add(current_url)
+            self.discovered_urls.update(urls_to_visit)
+            all_urls.update(urls_to_visit)
 
             if self.config.verbose:
-                console.print(f"[dim]Discovering links from: {current_url}[/dim]")
+                for current_url in urls_to_visit:
+                    console.print(f"[dim]Discovering links from: {current_url}[/dim]")
 
-            # Extract links from current page
-            links = await self._extract_links_from_html(client, current_url)
+            # Extract links from every page in the current level
+            results = await asyncio.gather(
+                *(self._extract_links_from_html(client, url) for url in urls_to_visit)
+            )
 
-            for link in links:
-                # Normalize URL (remove trailing slashes, anchors)
-                parsed = urlparse(link)
-                normalized = f"{parsed.scheme}://{parsed.netloc}{parsed.path}"
-                normalized = normalized.rstrip("/")
+            next_urls: dict[str, None] = {}
+            for links in results:
+                # Links come back already normalized (no trailing slashes or anchors)
+                for link in links:
+                    # Filter to only include URLs under base path
+                    if link not in self.discovered_urls and self.base_host in link:
+                        next_urls[link] = None
 
-                # Filter to only include URLs under base path
-                if normalized not in self.discovered_urls and self.base_host in normalized:
-                    urls_to_visit.append(normalized)
-                    all_urls.add(normalized)
+            urls_to_visit = list(next_urls)
 
         return list(all_urls)
 
-    def _extract_content(self, html: str) -> tuple[str, Tag | None]:
+    def _extract_content(self, content: bytes, encoding: str | None) -> tuple[str, Tag | None]:
         """Extract title and main content from HTML page."""
-        soup = BeautifulSoup(html, "html.parser")
+        # Raw bytes with a known encoding spare BeautifulSoup from sniffing the charset, and
+        # the strainer keeps the sidebar, scripts and other page chrome out of the tree
+        soup = BeautifulSoup(content, "lxml", parse_only=CONTENT_STRAINER, from_encoding=encoding)
 
         # Extract title
         title = ""
@@ -559,38 +662,40 @@ class ReadMeScraper:
         if not article:
             article = soup.find("main")
         if not article:
+            # Rare layout without article/main: parse the whole page for the role="main" div
+            soup = BeautifulSoup(content, "lxml", from_encoding=encoding)
             article = soup.find("div", {"role": "main"})
 
         if article:
-            # Remove unwanted elements
-            for elem in article.find_all(["nav", "aside", "footer"]):
-                elem.decompose()
+            # Remove unwanted elements and buttons in a single pass over the tree (this
+            # also covers the pagination and table of contents navs)
+            for elem in article.find_all(["nav", "aside", "footer", "button"]):
+                if elem.decomposed:
+                    continue
+                if elem.name != "button":
+                    elem.decompose()
+                    continue
 
-            # Remove buttons but keep their text if relevant
-            for btn in article.find_all("button"):
-                btn_text = btn.get_text().strip()
+                # Remove buttons but keep their text if relevant
+                btn_text = elem.get_text().strip()
                 # Keep meaningful button text as plain text
-                if btn_text and btn_text not in [
-                    "Copy",
-                    "Copy to clipboard",
-                    "Copy Code",
-                    "Try It!",
-                    "Show full URL",
-                    "Yes",
-                    "No",
-                    "RESPONSE",
-                ]:
-                    btn.replace_with(btn_text + " ")
+                if btn_text and btn_text not in CONTENT_BUTTON_LABELS:
+                    elem.replace_with(btn_text + " ")
                 else:
-                    btn.decompose()
+                    elem.decompose()
 
-            # Remove "Previous/Next" navigation
-            for nav in article.find_all("nav", {"aria-label": "Pagination Controls"}):
-                nav.decompose()
+            # Collect every page chrome marker in one pass, then remove each kind in turn
+            markers: dict[re.Pattern[str], list[NavigableString]] = {
+                pattern: [] for pattern in PAGE_CHROME_PATTERNS
+            }
+            for elem in article.find_all(string=PAGE_CHROME_RE):
+                for pattern, found in markers.items():
+                    if pattern.search(elem):
+                        found.append(elem)
 
             # Remove "Did this page help you?" section
-            for elem in article.find_all(string=re.compile(r"Did this page help you")):
-                parent = elem.find_parent()
+            for elem in markers[DID_THIS_HELP_RE]:
+                parent = None if elem.decomposed else elem.find_parent()
                 if parent:
                     # Go up to find the layout table containing this
                     for _ in range(5):
@@ -602,18 +707,14 @@ class ReadMeScraper:
                             break
 
             # Remove "Updated X ago" text
-            for elem in article.find_all(string=re.compile(r"Updated\s+.*ago")):
-                parent = elem.find_parent()
+            for elem in markers[UPDATED_AGO_RE]:
+                parent = None if elem.decomposed else elem.find_parent()
                 if parent:
                     parent.decompose()
 
-            # Remove table of contents nav on the right
-            for elem in article.find_all("nav", {"aria-label": "Table of contents"}):
-                elem.decompose()
-
             # Remove recent requests section
-            for elem in article.find_all(string=re.compile(r"Recent Requests")):
-                parent = elem.find_parent()
+            for elem in markers[RECENT_REQUESTS_RE]:
+                parent = None if elem.decomposed else elem.find_parent()
                 if parent:
                     # Find the section containing this
                     for _ in range(5):
@@ -627,8 +728,8 @@ class ReadMeScraper:
                             break
 
             # Remove language selector and code sample sections (right panel)
-            for elem in article.find_all(string=re.compile(r"^LANGUAGE$")):
-                parent = elem.find_parent()
+            for elem in markers[LANGUAGE_RE]:
+                parent = None if elem.decomposed else elem.find_parent()
                 if parent:
                     # Find the container div
                     for _ in range(10):
@@ -636,13 +737,13 @@ class ReadMeScraper:
                         if not parent:
                             break
                         # Check if this is the right panel container
-                        if parent.name == "div" and parent.find(string=re.compile(r"Try It!")):
+                        if parent.name == "div" and parent.find(string=TRY_IT_RE):
                             parent.decompose()
                             break
 
             # Remove Log in prompts
-            for elem in article.find_all(string=re.compile(r"Log in to see")):
-                parent = elem.find_parent()
+            for elem in markers[LOG_IN_RE]:
+                parent = None if elem.decomposed else elem.find_parent()
                 if parent:
                     for _ in range(3):
                         parent = parent.find_parent()
@@ -653,6 +754,18 @@ class ReadMeScraper:
 
         return title, article
 
+    def _parse_page(
+        self, content: bytes, encoding: str | None, url: str
+    ) -> tuple[str, str | None, dict[str, str]]:
+        """Extract a page's title and convert its main content (runs in a worker thread)."""
+        title, article = self._extract_content(content, encoding)
+        if article is None:
+            return title, None, {}
+
+        # Convert to Markdown (this also collects images to download)
+        markdown, images = self.converter.convert(article, url)
+        return title, markdown, images
+
     async def _process_url(
         self, client: httpx.AsyncClient, url: str, progress: Progress, task_id
     ) -> bool:
@@ -668,8 +781,7 @@ class ReadMeScraper:
             return True
 
         try:
-            async with self.semaphore:
-                response = await client.get(url, timeout=self.config.timeout)
+            response = await client.get(url)
 
             if response.status_code != 200:
                 self.stats.failed += 1
@@ -678,23 +790,27 @@ class ReadMeScraper:
                 progress.update(task_id, advance=1)
                 return False
 
-            # Extract content
-            title, content = self._extract_content(response.text)
-
-            if content:
-                # Convert to Markdown (this also collects images to download)
-                markdown = self.converter.convert(content, url)
-
-                # Download images
-                for img_url, img_local_path in self.converter.images_to_download:
-                    await self._download_image(client, img_url, img_local_path)
+            # Parse and convert in a worker thread so the event loop keeps serving other pages
+            title, markdown, images = await asyncio.to_thread(
+                self._parse_page, response.content, response.encoding, url
+            )
+
+            if markdown is not None:
+                # Download images concurrently, skipping ones already fetched for other pages
+                await asyncio.gather(
+                    *(
+                        self._download_image(client, img_url, img_local_path)
+                        for img_url, img_local_path in images.items()
+                        if img_url not in self.downloaded_images
+                    )
+                )
 
                 # Add title if not already in content
                 if title and not markdown.startswith(f"# {title}"):
                     markdown = f"# {title}\n\n{markdown}"
 
                 # Skip files with minimal content (just a title, no real content)
-                content_without_title = re.sub(r"^#\s+[^\n]+\n*", "", markdown).strip()
+                content_without_title = TITLE_LINE_RE.sub("", markdown).strip()
                 if len(content_without_title) < 10:
                     self.stats.skipped += 1
                     if self.config.verbose:
@@ -703,10 +819,10 @@ class ReadMeScraper:
                     return True
 
                 # Create directory and save file
-                os.makedirs(os.path.dirname(local_path), exist_ok=True)
+                await self._ensure_dir(os.path.dirname(local_path))
 
-                with open(local_path, "w", encoding="utf-8") as f:
-                    f.write(markdown)
+                async with aiofiles.open(local_path, "w", encoding="utf-8") as f:
+                    await f.write(markdown)
 
                 self.stats.downloaded += 1
                 if self.config.verbose:
@@ -740,6 +856,14 @@ class ReadMeScraper:
             headers={
                 "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
             },
+            # The connection pool is the concurrency limit: requests queue for a free
+            # connection (without timing out) and reuse it across same-host fetches
+            timeout=httpx.Timeout(self.config.timeout, pool=None),
+            limits=httpx.Limits(
+                max_connections=self.config.concurrency,
+                max_keepalive_connections=self.config.concurrency,
+                keepalive_expiry=75.0,
+            ),
         ) as client:
             # Discover all URLs by crawling the navigation
             console.print("[cyan]Discovering pages from navigation...[/cyan]")
@@ -776,7 +900,7 @@ class ReadMeScraper:
                 # Create tasks for all URLs
                 tasks = [self._process_url(client, url, progress, task_id) for url in urls]
 
-                # Run with concurrency limit (semaphore handles this)
+                # Run with concurrency limit (the connection pool handles this)
                 await asyncio.gather(*tasks)
 
         # Print summary
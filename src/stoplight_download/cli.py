@@ -25,6 +25,18 @@ console = Console()
     type=int,
     help="Number of concurrent downloads",
 )
+@click.option(
+    "--max-http-connections",
+    default=20,
+    type=int,
+    help="Maximum simultaneous HTTP requests (pages, sitemap and images)",
+)
+@click.option(
+    "--max-browser-pages",
+    default=None,
+    type=int,
+    help="Maximum pages rendered in the browser at once (defaults to --concurrency)",
+)
 @click.option(
     "--skip-existing",
     "-s",
@@ -41,6 +53,8 @@ def main(
     url: str,
     output: str,
     concurrency: int,
+    max_http_connections: int,
+    max_browser_pages: int | None,
     skip_existing: bool,
     verbose: bool,
 ) -> None:
@@ -58,6 +72,8 @@ def main(
         base_url=url,
         output_dir=output,
         concurrency=concurrency,
+        max_http_connections=max_http_connections,
+        max_browser_pages=max_browser_pages,
         skip_existing=skip_existing,
         verbose=verbose,
     )
@@ -1,21 +1,44 @@
 """Core scraper module for Stoplight documentation sites."""
 
 import asyncio
+import functools
 import hashlib
+import json
 import os
 import re
 from dataclasses import dataclass
 from urllib.parse import urljoin, urlparse
 from xml.etree import ElementTree
 
+import aiofiles
+import html2text
 import httpx
 from bs4 import BeautifulSoup
+from lxml import html as lxml_html
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 from playwright.async_api import async_playwright
 from rich.console import Console
 from rich.progress import BarColumn, Progress, SpinnerColumn, TaskID, TaskProgressColumn, TextColumn
 
 console = Console()
 
+# Markdown image references: ![alt](url)
+IMAGE_RE = re.compile(r"!\[([^\]]*)\]\(([^)]+)\)")
+
+# Paths that are API endpoints, static assets or bundles rather than doc pages
+SKIP_PATH_RE = re.compile(
+    r"/api/|/static/|\.(?:js|css|png|jpg|jpeg|gif|svg|ico|woff|woff2|ttf|eot)$"
+)
+
+# File in the output directory recording what earlier runs saved, for skip_existing
+STATE_FILENAME = ".scraper_state.json"
+
+# Read size when streaming images to disk
+IMAGE_CHUNK_SIZE = 64 * 1024
+
+# Converted markdown shorter than this is replaced by the content's plain text
+MIN_CONTENT_LENGTH = 100
+
 
 @dataclass
 class ScraperConfig:
@@ -27,6 +50,14 @@ class ScraperConfig:
     skip_existing: bool = False
     verbose: bool = False
     timeout: float = 30.0
+    # Simultaneous HTTP requests (sitemap, pre-rendered pages, images); also the pool size
+    max_http_connections: int = 20
+    # Pages rendered in the browser at once; defaults to concurrency
+    max_browser_pages: int | None = None
+    # Stoplight's rendered doc body: waited for in the browser and converted to markdown
+    content_selector: str = ".sl-markdown-viewer"
+    # Generic containers, only used when content_selector matches nothing
+    fallback_content_selector: str = "main, article, [role='main']"
 
 
 @dataclass
@@ -60,16 +91,42 @@ class StoplightScraper:
         path_match = re.match(r"/docs/([^/]+)", parsed.path)
         self.project_name = path_match.group(1) if path_match else "docs"
 
+        # Project path patterns, compiled once as they are checked for every link
+        project = re.escape(self.project_name)
+        self.doc_path_re = re.compile(rf"/docs/{project}/")
+        self.local_path_re = re.compile(rf"/docs/{project}/?(.*)")
+
         # URL tracking
         self.visited_urls: set[str] = set()
-        self.urls_to_visit: asyncio.Queue[str] = asyncio.Queue()
+        # None is a shutdown sentinel, one per worker, queued once the crawl drains
+        self.urls_to_visit: asyncio.Queue[str | None] = asyncio.Queue()
         self.downloaded_paths: set[str] = set()
         self.downloaded_images: set[str] = set()
-
-        # Semaphore for concurrency control
-        self.semaphore = asyncio.Semaphore(config.concurrency)
-
-    def _normalize_url(self, url: str) -> str:
+        self.downloaded_image_paths: set[str] = set()
+        self.created_dirs: set[str] = set()
+        # Pages written to disk, by this run or (with skip_existing) an earlier one
+        self.saved_pages: set[str] = set()
+        # Sidebars link every page to the same URLs, so remember each URL's verdict
+        self.doc_url_checks: dict[str, bool] = {}
+
+        # Whether the site serves pages already rendered (None until the first page is fetched)
+        self.prerendered: bool | None = None
+
+        # Separate limits for outbound HTTP requests and for browser rendering
+        self.http_semaphore = asyncio.Semaphore(config.max_http_connections)
+        self.page_semaphore = asyncio.Semaphore(config.max_browser_pages or config.concurrency)
+
+        # Browser, started the first time a page needs rendering. Each tab lives in its own
+        # context and goes back to idle_pages between renders.
+        self.playwright = None
+        self.browser = None
+        self.browser_lock = asyncio.Lock()
+        self.contexts: list = []
+        self.idle_pages: list = []
+
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _normalize_url(url: str) -> str:
         """Normalize URL by removing trailing slashes and fragments."""
         parsed = urlparse(url)
         normalized = f"{parsed.scheme}://{parsed.netloc}{parsed.path.rstrip('/')}"
@@ -77,6 +134,13 @@ class StoplightScraper:
 
     def _is_valid_doc_url(self, url: str) -> bool:
         """Check if URL is a valid documentation page under base_url."""
+        valid = self.doc_url_checks.get(url)
+        if valid is None:
+            valid = self.doc_url_checks[url] = self._check_doc_url(url)
+        return valid
+
+    def _check_doc_url(self, url: str) -> bool:
+        """Uncached check behind _is_valid_doc_url."""
         parsed = urlparse(url)
 
         # Must be same host
@@ -84,20 +148,11 @@ class StoplightScraper:
             return False
 
         # Must start with /docs/{project}/
-        if not re.match(rf"/docs/{re.escape(self.project_name)}/", parsed.path):
+        if not self.doc_path_re.match(parsed.path):
             return False
 
         # Skip non-doc paths
-        skip_patterns = [
-            r"/api/",
-            r"\.(js|css|png|jpg|jpeg|gif|svg|ico|woff|woff2|ttf|eot)$",
-            r"/static/",
-        ]
-        for pattern in skip_patterns:
-            if re.search(pattern, parsed.path):
-                return False
-
-        return True
+        return not SKIP_PATH_RE.search(parsed.path)
 
     def _get_local_path(self, url: str) -> str:
         """Convert URL to local file path."""
@@ -105,7 +160,7 @@ class StoplightScraper:
         path = parsed.path
 
         # Remove /docs/{project}/ prefix
-        match = re.match(rf"/docs/{re.escape(self.project_name)}/?(.*)", path)
+        match = self.local_path_re.match(path)
         if match:
             relative_path = match.group(1)
         else:
@@ -128,14 +183,17 @@ class StoplightScraper:
 
         return file_path
 
-    def _get_image_local_path(self, img_url: str) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _get_image_local_path(img_url: str) -> str:
         """Get local path for an image URL."""
         parsed = urlparse(img_url)
         path = parsed.path
 
         filename = os.path.basename(path)
         if not filename or "." not in filename:
-            url_hash = hashlib.md5(img_url.encode()).hexdigest()[:8]
+            # A 4-byte BLAKE2b digest is 8 hex chars
+            url_hash = hashlib.blake2b(img_url.encode(), digest_size=4).hexdigest()
             ext = ".png"
             if "." in path:
                 ext = os.path.splitext(path)[1] or ".png"
@@ -143,28 +201,50 @@ class StoplightScraper:
 
         return f"img/{filename}"
 
+    def _ensure_dir(self, path: str) -> None:
+        """Create a directory once, remembering it to skip repeated makedirs calls."""
+        if path in self.created_dirs:
+            return
+        os.makedirs(path, exist_ok=True)
+        self.created_dirs.add(path)
+
     async def _download_image(self, client: httpx.AsyncClient, url: str, local_path: str) -> bool:
         """Download an image to local path."""
-        if url in self.downloaded_images:
-            return True
+        full_path = os.path.join(self.config.output_dir, local_path)
 
-        try:
-            async with self.semaphore:
-                response = await client.get(url, timeout=self.config.timeout)
+        # Many images share a filename, so the first URL to claim a local file wins
+        if url in self.downloaded_images or full_path in self.downloaded_image_paths:
+            return True
 
-            if response.status_code != 200:
-                if self.config.verbose:
-                    console.print(
-                        f"[yellow]Failed to download image ({response.status_code}): {url}[/yellow]"
-                    )
-                self.stats.images_failed += 1
-                return False
+        # Keep images saved by a previous run
+        if self.config.skip_existing and os.path.exists(full_path):
+            self.downloaded_images.add(url)
+            self.downloaded_image_paths.add(full_path)
+            return True
 
-            full_path = os.path.join(self.config.output_dir, local_path)
-            os.makedirs(os.path.dirname(full_path), exist_ok=True)
+        # Claim the file before fetching so concurrent pages don't download it again
+        self.downloaded_image_paths.add(full_path)
 
-            with open(full_path, "wb") as f:
-                f.write(response.content)
+        try:
+            async with (
+                self.http_semaphore,
+                client.stream("GET", url, timeout=self.config.timeout) as response,
+            ):
+                if response.status_code != 200:
+                    if self.config.verbose:
+                        console.print(
+                            f"[yellow]Failed to download image ({response.status_code}): {url}[/yellow]"
+                        )
+                    self.downloaded_image_paths.discard(full_path)
+                    self.stats.images_failed += 1
+                    return False
+
+                self._ensure_dir(os.path.dirname(full_path))
+
+                # Save image chunk by chunk instead of buffering it whole in memory
+                async with aiofiles.open(full_path, "wb") as f:
+                    async for chunk in response.aiter_bytes(IMAGE_CHUNK_SIZE):
+                        await f.write(chunk)
 
             self.downloaded_images.add(url)
             self.stats.images_downloaded += 1
@@ -177,6 +257,7 @@ class StoplightScraper:
         except Exception as e:
             if self.config.verbose:
                 console.print(f"[yellow]Error downloading image {url}: {e}[/yellow]")
+            self.downloaded_image_paths.discard(full_path)
             self.stats.images_failed += 1
             return False
 
@@ -186,8 +267,15 @@ class StoplightScraper:
             # Wait for page to be mostly loaded
             await page.wait_for_load_state("domcontentloaded", timeout=20000)
 
-            # Wait for JS to render content
-            await asyncio.sleep(3)
+            # Wait for JS to render content: the content container if it shows up, otherwise
+            # until the network goes quiet
+            try:
+                await page.wait_for_selector(self.config.content_selector, timeout=8000)
+            except PlaywrightTimeoutError:
+                try:
+                    await page.wait_for_load_state("networkidle", timeout=5000)
+                except PlaywrightTimeoutError:
+                    pass
 
             # Use Playwright's evaluate to get the rendered content
             # This is more reliable for SPAs
@@ -205,80 +293,122 @@ class StoplightScraper:
             if self.config.verbose:
                 console.print(f"[dim]Content length from evaluate: {len(content_html)}[/dim]")
 
-            # Parse with BeautifulSoup
-            soup = BeautifulSoup(content_html, "html.parser")
-
-            # Remove navigation and sidebar elements
-            for tag in soup.find_all(["nav", "aside", "footer", "header"]):
-                tag.decompose()
-
-            # Find the body or main content
-            body = soup.find("body")
-            if body:
-                main = body
-            else:
-                main = soup
-
-            # Convert to markdown using html2text
-            try:
-                import html2text
-
-                h = html2text.HTML2Text()
-                h.body_width = 0
-                markdown = h.handle(str(main))
-                # If markdown is very short, try getting text directly
-                if len(markdown.strip()) < 100:
-                    return main.get_text(separator="\n", strip=True)
-                return markdown
-            except Exception:
-                # Fallback: extract text
-                return main.get_text(separator="\n", strip=True)
+            # Parsing and conversion are CPU-bound, so keep them off the event loop
+            return await asyncio.to_thread(self._html_to_markdown, content_html)
 
         except Exception as e:
             if self.config.verbose:
                 console.print(f"[yellow]Error extracting content: {e}[/yellow]")
             return None
 
-    async def _extract_links_from_page(self, page) -> list[str]:
-        """Extract internal links from the page sidebar."""
-        links = []
-
+    def _select_content(self, body: lxml_html.HtmlElement) -> lxml_html.HtmlElement:
+        """Find the doc body: content_selector first, then the generic fallback, then <body>."""
+        for selector in (self.config.content_selector, self.config.fallback_content_selector):
+            matches = body.cssselect(selector)
+            if matches:
+                return matches[0]
+        return body
+
+    def _html_to_markdown(self, content_html: str) -> str:
+        """Convert a page's HTML, minus navigation and sidebars, to markdown.
+
+        Runs in a worker thread, so it only touches local state. html2text converters
+        keep per-document state, so each call builds its own.
+        """
+        # Parse with lxml's C parser rather than building a BeautifulSoup tree
         try:
-            # Get all links from the page
-            html_content = await page.content()
-            soup = BeautifulSoup(html_content, "html.parser")
-
-            # Debug: print number of links found
-            all_links = soup.find_all("a", href=True)
-            if self.config.verbose:
-                console.print(f"[dim]Found {len(all_links)} total links[/dim]")
-
-            # Find all anchor tags with href
-            for a_tag in all_links:
-                href = str(a_tag.get("href", ""))
+            body = lxml_html.document_fromstring(content_html).body
+        except Exception:
+            return ""
 
-                # Skip external links, anchors, and javascript
-                if href.startswith(("http://", "https://")) and self.base_host not in href:
-                    continue
-                if href.startswith(("#", "javascript:", "mailto:", "tel:")):
-                    continue
+        return self._body_to_markdown(body)
 
-                # Convert to absolute URL
-                if not href.startswith(("http://", "https://")):
-                    absolute_url = urljoin(self.base_url, href)
-                else:
-                    absolute_url = href
+    def _body_to_markdown(self, body: lxml_html.HtmlElement) -> str:
+        """Convert a parsed page body, minus navigation and sidebars, to markdown."""
+        # Remove navigation and sidebar elements, nested ones included
+        for tag in body.xpath(".//nav | .//aside | .//footer | .//header"):
+            tag.drop_tree()
+        content = self._select_content(body)
+        content_html = lxml_html.tostring(content, encoding="unicode", with_tail=False)
 
-                normalized = self._normalize_url(absolute_url)
+        # Convert to markdown using html2text
+        try:
+            h = html2text.HTML2Text()
+            h.body_width = 0
+            markdown = h.handle(content_html)
+            if len(markdown.strip()) >= MIN_CONTENT_LENGTH:
+                return markdown
+        except Exception:
+            pass
 
-                if self._is_valid_doc_url(normalized):
-                    links.append(normalized)
+        # If markdown is very short, or conversion failed, get the text directly
+        return BeautifulSoup(content_html, "lxml").get_text(separator="\n", strip=True)
 
+    async def _extract_links_from_page(self, page) -> set[str]:
+        """Extract internal links from the page sidebar."""
+        try:
+            # Ask the browser for the hrefs rather than serializing the whole DOM; the href
+            # property is already resolved to an absolute URL. SVG links expose it as an
+            # object rather than a string, so those are dropped.
+            hrefs = await page.eval_on_selector_all(
+                "a[href]", "els => els.map(e => e.href).filter(h => typeof h === 'string')"
+            )
         except Exception as e:
             if self.config.verbose:
                 console.print(f"[yellow]Error extracting links: {e}[/yellow]")
+            return set()
+
+        return self._filter_doc_links(hrefs)
 
-        return list(set(links))
+    def _convert_prerendered(self, html_content: str) -> tuple[str | None, list[str]]:
+        """Convert fetched HTML to markdown and collect its hrefs, parsing it once.
+
+        The markdown is None when no content_selector element has any text, i.e. the page is
+        an SPA shell (whatever loading or noscript text it carries) that needs the browser.
+        Runs in a worker thread.
+        """
+        try:
+            body = lxml_html.document_fromstring(html_content).body
+        except Exception:
+            return None, []
+
+        # Taken before the sidebar is dropped, as plain str not tied to the parsed tree
+        hrefs = [str(href) for href in body.xpath(".//a/@href")]
+
+        rendered = body.cssselect(self.config.content_selector)
+        if not rendered or not rendered[0].text_content().strip():
+            return None, hrefs
+
+        return self._body_to_markdown(body), hrefs
+
+    def _filter_doc_links(self, hrefs: list[str]) -> set[str]:
+        """Normalize hrefs and keep those that are documentation pages."""
+        links: set[str] = set()
+
+        # Debug: print number of links found
+        if self.config.verbose:
+            console.print(f"[dim]Found {len(hrefs)} total links[/dim]")
+
+        # Check every anchor's href
+        for href in hrefs:
+            # Skip external links, anchors, and javascript
+            if href.startswith(("http://", "https://")) and self.base_host not in href:
+                continue
+            if href.startswith(("#", "javascript:", "mailto:", "tel:")):
+                continue
+
+            # Convert to absolute URL
+            if not href.startswith(("http://", "https://")):
+                absolute_url = urljoin(self.base_url, href)
+            else:
+                absolute_url = href
+
+            normalized = self._normalize_url(absolute_url)
+
+            if self._is_valid_doc_url(normalized):
+                links.add(normalized)
+
+        return links
 
     async def _fetch_sitemap_urls(self, client: httpx.AsyncClient) -> list[str]:
         """Fetch all page URLs from sitemap.xml."""
@@ -288,16 +418,24 @@ class StoplightScraper:
         sitemap_url = f"{parsed_base.scheme}://{parsed_base.netloc}/sitemap.xml"
 
         try:
-            response = await client.get(sitemap_url, timeout=self.config.timeout)
-            if response.status_code != 200:
-                return urls
-
-            root = ElementTree.fromstring(response.content)
-
-            for elem in root.iter():
-                if elem.tag.endswith("loc"):
-                    if elem.text:
-                        urls.append(elem.text)
+            async with (
+                self.http_semaphore,
+                client.stream("GET", sitemap_url, timeout=self.config.timeout) as response,
+            ):
+                if response.status_code != 200:
+                    return urls
+
+                # Parse the sitemap as it arrives, clearing each element once it is read so
+                # neither the whole document nor its tree is held in memory
+                parser = ElementTree.XMLPullParser(events=("end",))
+                async for chunk in response.aiter_bytes():
+                    parser.feed(chunk)
+                    for _, elem in parser.read_events():
+                        if elem.tag.endswith("loc"):
+                            if elem.text:
+                                urls.append(elem.text)
+                        elem.clear()
+                parser.close()
 
             if self.config.verbose and urls:
                 console.print(f"[green]Found {len(urls)} URLs in sitemap[/green]")
@@ -308,25 +446,89 @@ class StoplightScraper:
 
         return urls
 
-    async def _process_url(
-        self,
-        browser,
-        page,
-        client: httpx.AsyncClient,
-        url: str,
-        progress: Progress,
-        task_id: TaskID,
-    ) -> None:
-        """Process a single URL: download content and discover new links."""
+    async def _fetch_prerendered(
+        self, client: httpx.AsyncClient, url: str
+    ) -> tuple[str, set[str]] | None:
+        """Fetch a page over plain HTTP, returning (markdown, links) if rendered server-side.
+
+        Returns None when the page must be rendered in the browser instead: on errors, or
+        when content_selector has no rendered text in the HTML. If the first page fetched is
+        such a shell, the browser is used for all pages.
+        """
+        try:
+            async with self.http_semaphore:
+                response = await client.get(url, timeout=self.config.timeout)
+        except Exception as e:
+            if self.config.verbose:
+                console.print(f"[dim]Could not fetch {url} without the browser: {e}[/dim]")
+            return None
+
+        if response.status_code != 200:
+            return None
+
+        # Parsing and conversion are CPU-bound, so keep them off the event loop
+        content, hrefs = await asyncio.to_thread(self._convert_prerendered, response.text)
+        if content is None:
+            # Only the first page decides for the whole site; once pages are known to be
+            # pre-rendered, a shell is just sent to the browser on its own
+            if self.prerendered is None:
+                if self.config.verbose:
+                    console.print("[dim]Pages are rendered client-side, using the browser[/dim]")
+                self.prerendered = False
+            return None
+
+        self.prerendered = True
+        return content, self._filter_doc_links(hrefs)
+
+    async def _acquire_page(self):
+        """Take an idle browser tab, starting the browser on first use."""
+        async with self.browser_lock:
+            if self.browser is None:
+                if self.playwright is None:
+                    self.playwright = await async_playwright().start()
+                self.browser = await self.playwright.chromium.launch(headless=True)
+
+        if self.idle_pages:
+            return self.idle_pages.pop()
+
+        # One isolated context per tab, so navigations run in parallel
+        context = await self.browser.new_context()
+        self.contexts.append(context)
+        return await context.new_page()
+
+    async def _close_browser(self) -> None:
+        """Close the tabs and the browser, if it was ever started."""
+        for context in self.contexts:
+            await context.close()
+        if self.browser is not None:
+            await self.browser.close()
+        if self.playwright is not None:
+            await self.playwright.stop()
+
+    async def _render_page(self, url: str) -> tuple[str | None, set[str]] | None:
+        """Render a URL in the browser, returning its content and links, or None if it fails."""
+        async with self.page_semaphore:
+            try:
+                page = await self._acquire_page()
+            except Exception as e:
+                if self.config.verbose:
+                    console.print(f"[red]Could not start the browser for {url}: {e}[/red]")
+                return None
+
+            try:
+                return await self._render_in_page(page, url)
+            finally:
+                self.idle_pages.append(page)
+
+    async def _render_in_page(self, page, url: str) -> tuple[str | None, set[str]] | None:
+        """Render a URL in the given tab."""
         # Navigate to the page
         try:
             await page.goto(url, wait_until="domcontentloaded", timeout=self.config.timeout * 1000)
         except Exception as e:
-            self.stats.failed += 1
             if self.config.verbose:
                 console.print(f"[yellow]Failed to load {url}: {e}[/yellow]")
-            progress.update(task_id, advance=1)
-            return
+            return None
 
         # Extract content with its own timeout handling
         try:
@@ -336,20 +538,53 @@ class StoplightScraper:
                 console.print(f"[yellow]Error extracting content from {url}: {e}[/yellow]")
             content = None
 
+        # Extract links for discovery
+        new_links = await self._extract_links_from_page(page)
+
+        return content, new_links
+
+    async def _process_url(
+        self,
+        client: httpx.AsyncClient,
+        url: str,
+        progress: Progress,
+        task_id: TaskID,
+    ) -> None:
+        """Process a single URL: download content and discover new links."""
+        # Pages an earlier run saved are skipped before spending a request or a render on them
+        if url in self.saved_pages and os.path.exists(self._get_local_path(url)):
+            self.stats.skipped += 1
+            progress.update(task_id, advance=1)
+            return
+
+        # Pages the server already rendered need no browser at all
+        prerendered = None
+        if self.prerendered is not False:
+            prerendered = await self._fetch_prerendered(client, url)
+
+        if prerendered is not None:
+            content, new_links = prerendered
+        else:
+            rendered = await self._render_page(url)
+            if rendered is None:
+                self.stats.failed += 1
+                progress.update(task_id, advance=1)
+                return
+            content, new_links = rendered
+
         if content:
             local_path = self._get_local_path(url)
 
-            # Process images in content
-            content_str = content
+            # Point image references at the local copies in a single pass, collecting each
+            # image once so they can all be downloaded concurrently
+            images: dict[str, str] = {}
 
-            # Find image references
-            img_pattern = r"!\[([^\]]*)\]\(([^)]+)\)"
-            matches = re.findall(img_pattern, content_str)
+            def rewrite_image(match: re.Match[str]) -> str:
+                alt, img_url = match.groups()
 
-            for alt, img_url in matches:
                 # Skip data URLs and blob URLs
-                if not img_url or img_url.startswith(("data:", "blob:")):
-                    continue
+                if img_url.startswith(("data:", "blob:")):
+                    return match.group(0)
 
                 if not img_url.startswith(("http://", "https://")):
                     img_url_abs = urljoin(url, img_url)
@@ -358,26 +593,35 @@ class StoplightScraper:
 
                 # Skip blob URLs after join
                 if img_url_abs.startswith("blob:"):
-                    continue
+                    return match.group(0)
 
                 local_img_path = self._get_image_local_path(img_url_abs)
-                await self._download_image(client, img_url_abs, local_img_path)
-                content_str = content_str.replace(
-                    f"![{alt}]({img_url})", f"![{alt}]({local_img_path})"
+                images[img_url_abs] = local_img_path
+                return f"![{alt}]({local_img_path})"
+
+            content_str = IMAGE_RE.sub(rewrite_image, content)
+
+            await asyncio.gather(
+                *(
+                    self._download_image(client, img_url, local_img_path)
+                    for img_url, local_img_path in images.items()
                 )
+            )
 
             # Skip if file exists
             if self.config.skip_existing and os.path.exists(local_path):
+                self.saved_pages.add(url)
                 self.stats.skipped += 1
                 if self.config.verbose:
                     console.print(f"[dim]Skipped (exists): {local_path}[/dim]")
             else:
-                os.makedirs(os.path.dirname(local_path), exist_ok=True)
-                with open(local_path, "w", encoding="utf-8") as f:
-                    f.write(content_str)
+                self._ensure_dir(os.path.dirname(local_path))
+                async with aiofiles.open(local_path, "w", encoding="utf-8") as f:
+                    await f.write(content_str)
 
                 self.stats.downloaded += 1
                 self.downloaded_paths.add(local_path)
+                self.saved_pages.add(url)
 
                 if self.config.verbose:
                     console.print(f"[green]Downloaded: {local_path}[/green]")
@@ -386,40 +630,98 @@ class StoplightScraper:
             if self.config.verbose:
                 console.print(f"[yellow]No content found for: {url}[/yellow]")
 
-        # Extract links for discovery
-        new_links = await self._extract_links_from_page(page)
-
+        # Queue links not seen before (the queue is unbounded, so put_nowait never blocks)
+        new_links -= self.visited_urls
+        self.visited_urls |= new_links
+        self.stats.discovered += len(new_links)
         for link in new_links:
-            if link not in self.visited_urls:
-                self.visited_urls.add(link)
-                await self.urls_to_visit.put(link)
-                self.stats.discovered += 1
+            self.urls_to_visit.put_nowait(link)
 
         progress.update(task_id, advance=1)
 
     async def _worker(
         self,
-        browser,
-        page,
         client: httpx.AsyncClient,
         progress: Progress,
         task_id: TaskID,
     ) -> None:
         """Worker coroutine that processes URLs from the queue."""
         while True:
-            try:
-                url = await asyncio.wait_for(self.urls_to_visit.get(), timeout=5.0)
-            except asyncio.TimeoutError:
+            url = await self.urls_to_visit.get()
+            if url is None:
+                self.urls_to_visit.task_done()
                 break
 
             try:
-                await self._process_url(browser, page, client, url, progress, task_id)
+                await self._process_url(client, url, progress, task_id)
             except Exception as e:
                 if self.config.verbose:
                     console.print(f"[red]Error processing {url}: {e}[/red]")
             finally:
                 self.urls_to_visit.task_done()
 
+    async def _load_state(self) -> None:
+        """Load the pages and images saved by a previous run, dropping any since deleted."""
+        try:
+            path = os.path.join(self.config.output_dir, STATE_FILENAME)
+            async with aiofiles.open(path, encoding="utf-8") as f:
+                state = json.loads(await f.read())
+        except (OSError, ValueError):
+            return
+
+        self.saved_pages.update(state.get("pages", []))
+        for url in state.get("images", []):
+            full_path = os.path.join(self.config.output_dir, self._get_image_local_path(url))
+            if os.path.exists(full_path):
+                self.downloaded_images.add(url)
+                self.downloaded_image_paths.add(full_path)
+
+    async def _save_state(self) -> None:
+        """Record the pages and images saved so far for the next run."""
+        if not self.saved_pages and not self.downloaded_images:
+            return
+
+        state = {"pages": sorted(self.saved_pages), "images": sorted(self.downloaded_images)}
+        try:
+            path = os.path.join(self.config.output_dir, STATE_FILENAME)
+            async with aiofiles.open(path, "w", encoding="utf-8") as f:
+                await f.write(json.dumps(state))
+        except OSError as e:
+            if self.config.verbose:
+                console.print(f"[yellow]Could not save state {STATE_FILENAME}: {e}[/yellow]")
+
+    async def _queue_start_urls(self, client: httpx.AsyncClient) -> None:
+        """Queue the sitemap's pages, or the base URL when there is no sitemap."""
+        # Try sitemap first
+        sitemap_urls = await self._fetch_sitemap_urls(client)
+        project_urls = [url for url in sitemap_urls if self.doc_path_re.search(url)]
+
+        if project_urls:
+            # Normalize, deduplicate and filter in bulk (keeping sitemap order), then
+            # queue everything at once; the queue is unbounded, so nothing waits.
+            # Pages saved earlier are queued as well: they are skipped without being
+            # rendered, so links on them that led to pages missing from the sitemap
+            # would otherwise never be found.
+            candidates = [*map(self._normalize_url, project_urls), *self.saved_pages]
+            new_urls = [
+                url
+                for url in dict.fromkeys(candidates)
+                if url not in self.visited_urls and self._is_valid_doc_url(url)
+            ]
+            self.visited_urls.update(new_urls)
+            self.stats.discovered += len(new_urls)
+            for url in new_urls:
+                self.urls_to_visit.put_nowait(url)
+        else:
+            # Without a sitemap, links are only found by rendering pages, so pages
+            # saved earlier still have to be visited
+            self.saved_pages.clear()
+
+            # Fallback: start with base URL
+            self.visited_urls.add(self.base_url)
+            await self.urls_to_visit.put(self.base_url)
+            self.stats.discovered += 1
+
     async def run(self) -> ScraperStats:
         """Run the scraper."""
         console.print("[bold blue]Stoplight Scraper[/bold blue]")
@@ -430,38 +732,27 @@ class StoplightScraper:
 
         os.makedirs(self.config.output_dir, exist_ok=True)
 
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=True)
-            page = await browser.new_page()
+        if self.config.skip_existing:
+            await self._load_state()
 
+        # Save what was downloaded and close the browser even if the crawl fails or is
+        # interrupted, so the next run can pick up from there
+        try:
+            # HTTP/2 multiplexes a page's many image requests over one connection per host
             async with httpx.AsyncClient(
+                http2=True,
                 follow_redirects=True,
                 headers={
                     "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
                 },
+                timeout=httpx.Timeout(self.config.timeout, connect=10.0),
+                limits=httpx.Limits(
+                    max_connections=self.config.max_http_connections,
+                    max_keepalive_connections=self.config.max_http_connections,
+                    keepalive_expiry=30.0,
+                ),
             ) as client:
-                # Try sitemap first
-                sitemap_urls = await self._fetch_sitemap_urls(client)
-                project_urls = [
-                    url
-                    for url in sitemap_urls
-                    if re.search(rf"/docs/{re.escape(self.project_name)}/", url)
-                ]
-
-                if project_urls:
-                    for url in project_urls:
-                        normalized = self._normalize_url(url)
-                        if normalized not in self.visited_urls and self._is_valid_doc_url(
-                            normalized
-                        ):
-                            self.visited_urls.add(normalized)
-                            await self.urls_to_visit.put(normalized)
-                            self.stats.discovered += 1
-                else:
-                    # Fallback: start with base URL
-                    self.visited_urls.add(self.base_url)
-                    await self.urls_to_visit.put(self.base_url)
-                    self.stats.discovered += 1
+                await self._queue_start_urls(client)
 
                 with Progress(
                     SpinnerColumn(),
@@ -472,19 +763,23 @@ class StoplightScraper:
                 ) as progress:
                     task_id: TaskID = progress.add_task("[cyan]Processing pages...", total=None)
 
-                    workers = [
-                        asyncio.create_task(self._worker(browser, page, client, progress, task_id))
-                        for _ in range(self.config.concurrency)
-                    ]
-
-                    await self.urls_to_visit.join()
+                    # The task group waits for every worker to exit, and cancels the rest
+                    # (and the wait for the queue) if one fails or the run is interrupted
+                    async with asyncio.TaskGroup() as tg:
+                        for _ in range(self.config.concurrency):
+                            tg.create_task(self._worker(client, progress, task_id))
 
-                    for worker in workers:
-                        worker.cancel()
+                        await self.urls_to_visit.join()
 
-                    await asyncio.gather(*workers, return_exceptions=True)
-
-            await browser.close()
+                        # The queue only drains once every in-flight page has queued its
+                        # links, so it is now safe to tell each worker to exit
+                        for _ in range(self.config.concurrency):
+                            self.urls_to_visit.put_nowait(None)
+        finally:
+            try:
+                await self._close_browser()
+            finally:
+                await self._save_state()
 
         console.print()
         console.print("[bold green]✓ Scraping complete![/bold green]")
@@ -0,0 +1,41 @@
+"""Tests for MkDocs content extraction."""
+
+from mkdocs_download.scraper import MkDocsScraper
+
+
+def test_extract_content_removes_last_updated_and_keeps_article():
+    html = (
+        '<div class="md-content"><article><h1>T</h1><p>Body text</p>'
+        "<p><small>Last updated: <span>2024</span></small></p></article></div>"
+    )
+
+    title, main = MkDocsScraper._extract_content(html)
+
+    assert title == "T"
+    assert main is not None
+    assert "Body text" in main.get_text()
+    assert "Last updated" not in main.get_text()
+    assert "2024" not in main.get_text()
+
+
+def test_extract_content_removes_revision_date_plugin():
+    html = (
+        "<article><h1>T</h1><p>Body text</p>"
+        '<aside class="md-source-file"><span class="md-source-file__fact">'
+        '<span class="git-revision-date-localized-plugin">May 1, 2024</span></span></aside>'
+        "</article>"
+    )
+
+    _, main = MkDocsScraper._extract_content(html)
+
+    assert main is not None
+    assert main.get_text() == "TBody text"
+
+
+def test_extract_content_keeps_parent_of_last_updated_block():
+    html = "<article><h1>T</h1><div>Intro<p>Last modified today</p><p>Kept</p></div></article>"
+
+    _, main = MkDocsScraper._extract_content(html)
+
+    assert main is not None
+    assert main.get_text() == "TIntroKept"